@@ -103,12 +103,14 @@ class Hdf5Formatter(qt.QObject):
             numpy_object = dataset[()]
             text = self.__formatter.toString(numpy_object, dtype=dataset.dtype)
         else:
-            if dataset.size < 5 and dataset.compression is None:
+            # Requesting the compression reads the dataset creation properties
+            compression = dataset.compression
+            if dataset.size < 5 and compression is None:
                 numpy_object = dataset[0:5]
                 text = self.__formatter.toString(numpy_object, dtype=dataset.dtype)
             else:
                 dimension = len(dataset.shape)
-                if dataset.compression is not None:
+                if compression is not None:
                     text = "Compressed %dD data" % dimension
                 else:
                     text = "%dD data" % dimension
@@ -27,10 +27,19 @@ __license__ = "MIT"
 __date__ = "16/06/2017"
 
 
+import functools
+
 from .. import qt
 from .Hdf5TreeModel import Hdf5TreeModel
 
 
+_RESIZE_CONTENTS_PRECISION = 200
+"""Maximum number of rows measured to auto-resize a column to its content.
+
+The visible rows are measured first. Qt default (1000) can require to load
+many HDF5 nodes which are not displayed."""
+
+
 class Hdf5HeaderView(qt.QHeaderView):
     """
     Default HDF5 header
@@ -54,9 +63,12 @@ class Hdf5HeaderView(qt.QHeaderView):
         self.setSectionsMovable(True)
         self.setDefaultAlignment(qt.Qt.AlignLeft | qt.Qt.AlignVCenter)
         self.setStretchLastSection(True)
+        self.setResizeContentsPrecision(_RESIZE_CONTENTS_PRECISION)
 
         self.__auto_resize = True
         self.__hide_columns_popup = True
+        self.__hide_columns_menu = None
+        self.__hide_columns_actions = {}
 
     def setModel(self, model):
         """Override model to configure view when a model is expected
@@ -66,7 +78,13 @@ class Hdf5HeaderView(qt.QHeaderView):
 
         :param model qt.QAbstractItemModel: A model
         """
+        previousModel = self.model()
+        if previousModel is not None:
+            previousModel.headerDataChanged.disconnect(self.__invalidateContextMenu)
+        self.__invalidateContextMenu()
         super(Hdf5HeaderView, self).setModel(model)
+        if model is not None:
+            model.headerDataChanged.connect(self.__invalidateContextMenu)
         self.__updateAutoResize()
 
     def __updateAutoResize(self):
@@ -128,29 +146,38 @@ class Hdf5HeaderView(qt.QHeaderView):
     enableHideColumnsPopup = qt.Property(bool, hasHideColumnsPopup, setAutoResizeColumns)
     """Property to enable/disable popup allowing to hide/show columns."""
 
-    def __genHideSectionEvent(self, column):
-        """Generate a callback which change the column visibility according to
-        the event parameter
+    def _toggleSection(self, column, checked):
+        """Change the visibility of a column
 
         :param int column: logical id of the column
-        :rtype: callable
+        :param bool checked: True to display the column
         """
-        return lambda checked: self.setSectionHidden(column, not checked)
+        self.setSectionHidden(column, not checked)
 
-    def __createContextMenu(self, pos):
-        """Callback to create and display a context menu
+    def __invalidateContextMenu(self, *args):
+        """Drop the cached menu to display/hide columns"""
+        if self.__hide_columns_menu is not None:
+            self.__hide_columns_menu.deleteLater()
+        self.__hide_columns_menu = None
+        self.__hide_columns_actions = {}
 
-        :param pos qt.QPoint: Requested position for the context menu
-        """
-        if not self.__hide_columns_popup:
-            return
+    def __getContextMenu(self):
+        """Returns a cached version of the menu to display/hide columns.
 
+        The menu is created again when the number of columns changes.
+
+        :rtype: qt.QMenu
+        """
         model = self.model()
-        if model.columnCount() > 1:
+        if len(self.__hide_columns_actions) != model.columnCount() - 1:
+            self.__invalidateContextMenu()
+
+        if self.__hide_columns_menu is None:
             menu = qt.QMenu(self)
             menu.setTitle("Display/hide columns")
+            menu.aboutToShow.connect(self.__updateContextMenu)
 
-            action = qt.QAction("Display/hide column", self)
+            action = qt.QAction("Display/hide column", menu)
             action.setEnabled(False)
             menu.addAction(action)
 
@@ -159,12 +186,32 @@ class Hdf5HeaderView(qt.QHeaderView):
                     # skip the main column
                     continue
                 text = model.headerData(column, qt.Qt.Horizontal, qt.Qt.DisplayRole)
-                action = qt.QAction("%s displayed" % text, self)
+                action = qt.QAction("%s displayed" % text, menu)
                 action.setCheckable(True)
-                action.setChecked(not self.isSectionHidden(column))
-                action.toggled.connect(self.__genHideSectionEvent(column))
+                action.toggled.connect(functools.partial(self._toggleSection, column))
                 menu.addAction(action)
+                self.__hide_columns_actions[column] = action
+            self.__hide_columns_menu = menu
+        return self.__hide_columns_menu
+
+    def __updateContextMenu(self):
+        """Synchronize the menu to display/hide columns with the header"""
+        for column, action in self.__hide_columns_actions.items():
+            wasBlocked = action.blockSignals(True)
+            action.setChecked(not self.isSectionHidden(column))
+            action.blockSignals(wasBlocked)
+
+    def __createContextMenu(self, pos):
+        """Callback to create and display a context menu
+
+        :param pos qt.QPoint: Requested position for the context menu
+        """
+        if not self.__hide_columns_popup:
+            return
 
+        model = self.model()
+        if model.columnCount() > 1:
+            menu = self.__getContextMenu()
             menu.popup(self.viewport().mapToGlobal(pos))
 
     def setSections(self, logicalIndexes):
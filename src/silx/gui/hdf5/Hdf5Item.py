@@ -29,8 +29,12 @@ __date__ = "17/01/2019"
 
 import logging
 import enum
+import weakref
 from typing import Optional
 
+import h5py
+import h5py.h5l
+
 from .. import qt
 from .. import icons
 from . import _utils
@@ -43,6 +47,34 @@ _formatter = TextFormatter()
 _hdf5Formatter = Hdf5Formatter(textFormatter=_formatter)
 # FIXME: The formatter should be an attribute of the Hdf5Model
 
+_H5L_TYPE_TO_H5TYPE = {
+    h5py.h5l.TYPE_HARD: silx.io.utils.H5Type.HARD_LINK,
+    h5py.h5l.TYPE_SOFT: silx.io.utils.H5Type.SOFT_LINK,
+    h5py.h5l.TYPE_EXTERNAL: silx.io.utils.H5Type.EXTERNAL_LINK,
+}
+"""Mapping from low level h5py link types to H5Type"""
+
+_GROUP_H5TYPES = frozenset([silx.io.utils.H5Type.GROUP, silx.io.utils.H5Type.FILE])
+"""H5Type of objects containing children"""
+
+_standardIcons = weakref.WeakValueDictionary()
+"""Cache standard icons of the style in a weak structure"""
+
+
+def _getStandardIcon(pixmap):
+    """Returns a standard icon of the application style.
+
+    Icons are shared while they are used by at least one item.
+
+    :param qt.QStyle.StandardPixmap pixmap: Identifier of the icon
+    :rtype: qt.QIcon
+    """
+    icon = _standardIcons.get(pixmap)
+    if icon is None:
+        icon = qt.QApplication.style().standardIcon(pixmap)
+        _standardIcons[pixmap] = icon
+    return icon
+
 
 class DescriptionType(enum.Enum):
     """List of available kind of description.
@@ -61,6 +93,25 @@ class Hdf5Item(Hdf5Node):
     tree structure.
     """
 
+    __slots__ = (
+        "__obj",
+        "__key",
+        "__h5Class",
+        "__h5pyClass",
+        "__isBroken",
+        "__error",
+        "__text",
+        "__linkClass",
+        "__description",
+        "__nx_class",
+        "__expectedChildCount",
+        "__value",
+        "__shape",
+        "__type",
+        "__icon",
+        "__tooltip",
+    )
+
     def __init__(
         self,
         text: Optional[str],
@@ -80,12 +131,19 @@ class Hdf5Item(Hdf5Node):
         self.__obj = obj
         self.__key = key
         self.__h5Class = h5Class
+        self.__h5pyClass = None
         self.__isBroken = obj is None and h5Class is None
         self.__error = None
         self.__text = text
         self.__linkClass = linkClass
         self.__description = None
+        self.__value = None
+        self.__shape = None
+        self.__type = None
+        self.__icon = None
+        self.__tooltip = None
         self.__nx_class = None
+        self.__expectedChildCount = None
         Hdf5Node.__init__(self, parent, populateAll=populateAll, openedPath=openedPath)
 
     def _getCanonicalName(self):
@@ -129,8 +187,10 @@ class Hdf5Item(Hdf5Node):
 
         :rtype: h5py.File or h5py.Dataset or h5py.Group
         """
-        type_ = self.h5Class
-        return silx.io.utils.h5type_to_h5py_class(type_)
+        if self.__h5pyClass is None:
+            type_ = self.h5Class
+            self.__h5pyClass = silx.io.utils.h5type_to_h5py_class(type_)
+        return self.__h5pyClass
 
     @property
     def linkClass(self):
@@ -146,9 +206,7 @@ class Hdf5Item(Hdf5Node):
 
         :rtype: bool
         """
-        if self.h5Class is None:
-            return False
-        return self.h5Class in [silx.io.utils.H5Type.GROUP, silx.io.utils.H5Type.FILE]
+        return self.h5Class in _GROUP_H5TYPES
 
     def isBrokenObj(self):
         """Returns true if the stored HDF5 object is broken.
@@ -170,9 +228,12 @@ class Hdf5Item(Hdf5Node):
         return _hdf5Formatter
 
     def _expectedChildCount(self):
-        if self.isGroupObj():
-            return len(self.obj)
-        return 0
+        if self.__expectedChildCount is None:
+            if self.isGroupObj():
+                self.__expectedChildCount = len(self.obj)
+            else:
+                self.__expectedChildCount = 0
+        return self.__expectedChildCount
 
     def __initH5Object(self):
         """Lazy load of the HDF5 node. It is reached from the parent node
@@ -238,7 +299,43 @@ class Hdf5Item(Hdf5Node):
 
         self.__key = None
 
+    def __getLinkClasses(self):
+        """Returns the link class of each child of an h5py group.
+
+        The links are read in a single pass over the group, instead of
+        one request per child.
+
+        :returns: A dict from child name to H5Type, else None if the object
+            is not an h5py group or the links can't be iterated
+        :rtype: Union[Dict[str,H5Type],None]
+        """
+        obj = self.obj
+        if not isinstance(obj, h5py.Group):
+            return None
+        linkClasses = {}
+
+        def collect(name, info):
+            link = _H5L_TYPE_TO_H5TYPE.get(info.type)
+            if link is None:
+                return None
+            # Same decoding as h5py.Group iteration
+            try:
+                name = name.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+            linkClasses[name] = link
+            return None
+
+        try:
+            obj.id.links.iterate(collect, info=True)
+        except Exception:
+            _logger.debug("Backtrace", exc_info=True)
+            return None
+        return linkClasses
+
     def _populateChild(self, populateAll=False):
+        # Children are created with a key only: their own HDF5 objects and
+        # children are reached lazily, whatever `populateAll` is.
         if self.isGroupObj():
             keys = []
             try:
@@ -258,11 +355,16 @@ class Hdf5Item(Hdf5Node):
                         lib_name = self.obj.__class__.__module__.split(".")[0]
                         _logger.error("Internal %s error (second time). The file is corrupted.", lib_name)
                         _logger.debug("Backtrace", exc_info=True)
+            linkClasses = self.__getLinkClasses() if keys else None
             for name in keys:
                 try:
+                    # The prefetched link type does not tell the class of
+                    # the object: it is still requested for each child
                     class_ = self.obj.get(name, getclass=True)
-                    link = self.obj.get(name, getclass=True, getlink=True)
-                    link = silx.io.utils.get_h5_class(class_=link)
+                    link = None if linkClasses is None else linkClasses.get(name)
+                    if link is None:
+                        link = self.obj.get(name, getclass=True, getlink=True)
+                        link = silx.io.utils.get_h5_class(class_=link)
                 except Exception:
                     lib_name = self.obj.__class__.__module__.split(".")[0]
                     _logger.error("Internal %s error", lib_name)
@@ -292,6 +394,39 @@ class Hdf5Item(Hdf5Node):
             return False
         return Hdf5Node.hasChildren(self)
 
+    def __getValueText(self):
+        """Returns a cached version of the human readable value of the
+        dataset.
+
+        The formatter only reads the data for scalars and very small
+        datasets, which is then done once per item.
+
+        :rtype: str
+        """
+        if self.__value is None:
+            self.__value = self._getFormatter().humanReadableValue(self.obj)
+        return self.__value
+
+    def __getShapeText(self):
+        """Returns a cached version of the human readable shape of the
+        dataset.
+
+        :rtype: str
+        """
+        if self.__shape is None:
+            self.__shape = self._getFormatter().humanReadableShape(self.obj)
+        return self.__shape
+
+    def __getTypeText(self):
+        """Returns a cached version of the human readable type of the
+        dataset.
+
+        :rtype: str
+        """
+        if self.__type is None:
+            self.__type = self._getFormatter().humanReadableType(self.obj)
+        return self.__type
+
     def _getDefaultIcon(self):
         """Returns the icon displayed by the main column.
 
@@ -299,19 +434,17 @@ class Hdf5Item(Hdf5Node):
         """
         # Pre-fetch the object, in case it is broken
         obj = self.obj
-        style = qt.QApplication.style()
         if self.__isBroken:
-            icon = style.standardIcon(qt.QStyle.SP_MessageBoxCritical)
-            return icon
+            return _getStandardIcon(qt.QStyle.SP_MessageBoxCritical)
         class_ = self.h5Class
         if class_ == silx.io.utils.H5Type.FILE:
-            return style.standardIcon(qt.QStyle.SP_FileIcon)
+            return _getStandardIcon(qt.QStyle.SP_FileIcon)
         elif class_ == silx.io.utils.H5Type.GROUP:
-            return style.standardIcon(qt.QStyle.SP_DirIcon)
+            return _getStandardIcon(qt.QStyle.SP_DirIcon)
         elif class_ == silx.io.utils.H5Type.SOFT_LINK:
-            return style.standardIcon(qt.QStyle.SP_DirLinkIcon)
+            return _getStandardIcon(qt.QStyle.SP_DirLinkIcon)
         elif class_ == silx.io.utils.H5Type.EXTERNAL_LINK:
-            return style.standardIcon(qt.QStyle.SP_FileLinkIcon)
+            return _getStandardIcon(qt.QStyle.SP_FileLinkIcon)
         elif class_ == silx.io.utils.H5Type.DATASET:
             if obj.shape is None:
                 name = "item-none"
@@ -335,8 +468,8 @@ class Hdf5Item(Hdf5Node):
             attributeDict["#Title"] = "HDF5 Dataset"
             attributeDict["Name"] = self.basename
             attributeDict["Path"] = self.obj.name
-            attributeDict["Shape"] = self._getFormatter().humanReadableShape(self.obj)
-            attributeDict["Value"] = self._getFormatter().humanReadableValue(self.obj)
+            attributeDict["Shape"] = self.__getShapeText()
+            attributeDict["Value"] = self.__getValueText()
             attributeDict["Data type"] = self._getFormatter().humanReadableType(self.obj, full=True)
         elif self.h5Class == silx.io.utils.H5Type.GROUP:
             attributeDict["#Title"] = "HDF5 Group"
@@ -368,8 +501,8 @@ class Hdf5Item(Hdf5Node):
 
         :rtype: str
         """
+        self.obj  # lazy loading of the object
         if self.__error is not None:
-            self.obj  # lazy loading of the object
             return self.__error
 
         attrs = self._createTooltipAttributes()
@@ -381,6 +514,24 @@ class Hdf5Item(Hdf5Node):
 
         return tooltip
 
+    def __getIcon(self):
+        """Returns a cached version of the default icon
+
+        :rtype: qt.QIcon
+        """
+        if self.__icon is None:
+            self.__icon = self._getDefaultIcon()
+        return self.__icon
+
+    def __getTooltip(self):
+        """Returns a cached version of the default tooltip
+
+        :rtype: str
+        """
+        if self.__tooltip is None:
+            self.__tooltip = self._getDefaultTooltip()
+        return self.__tooltip
+
     @property
     def nexusClassName(self):
         """Returns the Nexus class name"""
@@ -414,9 +565,9 @@ class Hdf5Item(Hdf5Node):
         if role == qt.Qt.DisplayRole:
             return self.__text
         if role == qt.Qt.DecorationRole:
-            return self._getDefaultIcon()
+            return self.__getIcon()
         if role == qt.Qt.ToolTipRole:
-            return self._getDefaultTooltip()
+            return self.__getTooltip()
         return None
 
     def dataType(self, role):
@@ -432,7 +583,7 @@ class Hdf5Item(Hdf5Node):
             if self.isGroupObj():
                 text = self.nexusClassName
             elif class_ == silx.io.utils.H5Type.DATASET:
-                text = self._getFormatter().humanReadableType(self.obj)
+                text = self.__getTypeText()
             else:
                 text = ""
             return text
@@ -450,7 +601,7 @@ class Hdf5Item(Hdf5Node):
             class_ = self.h5Class
             if class_ != silx.io.utils.H5Type.DATASET:
                 return ""
-            return self._getFormatter().humanReadableShape(self.obj)
+            return self.__getShapeText()
         return None
 
     def dataValue(self, role):
@@ -464,7 +615,7 @@ class Hdf5Item(Hdf5Node):
                 return ""
             if self.h5Class != silx.io.utils.H5Type.DATASET:
                 return ""
-            return self._getFormatter().humanReadableValue(self.obj)
+            return self.__getValueText()
         return None
 
     _NEXUS_CLASS_TO_VALUE_CHILDREN = {
@@ -538,7 +689,7 @@ class Hdf5Item(Hdf5Node):
             return DescriptionType.ERROR, self.__error
 
         if self.h5Class == silx.io.utils.H5Type.DATASET:
-            return DescriptionType.VALUE, self._getFormatter().humanReadableValue(self.obj)
+            return DescriptionType.VALUE, self.__getValueText()
 
         elif self.isGroupObj() and self.nexusClassName:
             # For NeXus groups, try to find a title or name
@@ -551,7 +702,7 @@ class Hdf5Item(Hdf5Node):
                     if (isinstance(child, Hdf5Item) and
                             child.h5Class == silx.io.utils.H5Type.DATASET and
                             child.basename == child_name):
-                        return kind, self._getFormatter().humanReadableValue(child.obj)
+                        return kind, child.__getValueText()
 
         description = self.obj.attrs.get("desc", None)
         if description is not None:
@@ -606,14 +757,12 @@ class Hdf5Item(Hdf5Node):
         if role == qt.Qt.DisplayRole:
             if self.isBrokenObj():
                 return ""
-            class_ = self.obj.__class__
-            text = class_.__name__.split(".")[-1]
-            return text
+            return self.obj.__class__.__name__
         if role == qt.Qt.ToolTipRole:
-            class_ = self.obj.__class__
-            if class_ is None:
+            obj = self.obj
+            if obj is None:
                 return ""
-            return "Class name: %s" % self.__class__
+            return "Class name: %s" % obj.__class__.__name__
         return None
 
     def dataLink(self, role):
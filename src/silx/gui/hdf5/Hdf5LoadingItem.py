@@ -39,6 +39,8 @@ class Hdf5LoadingItem(Hdf5Node):
     At the end of the loading this item is replaced by the loaded one.
     """
 
+    __slots__ = ("__text", "__animatedIcon")
+
     def __init__(
         self,
         text,
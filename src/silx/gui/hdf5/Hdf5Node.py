@@ -36,6 +36,9 @@ class Hdf5Node(object):
     It provides link to the childs and to the parents, and a link to an
     external object.
     """
+
+    __slots__ = ("__child", "__childIndex", "__parent", "__openedPath", "__weakref__")
+
     def __init__(
         self,
         parent=None,
@@ -46,12 +49,13 @@ class Hdf5Node(object):
         Constructor
 
         :param Hdf5Node parent: Parent of the node, if exists, else None
-        :param bool populateAll: If true, populate all the tree node. Else
-            everything is lazy loaded.
+        :param bool populateAll: If true, populate the direct children of
+            the node at construction. Deeper levels are always lazy loaded.
         :param openedPath:
             The url or filename the node was created from, None if not directly created
         """
         self.__child = None
+        self.__childIndex = None
         self.__parent = None
         self.__openedPath = openedPath
         if parent is not None:
@@ -106,6 +110,8 @@ class Hdf5Node(object):
         """
         self.__initChild()
         self.__child.append(child)
+        if self.__childIndex is not None:
+            self.__childIndex[child] = len(self.__child) - 1
 
     def removeChildAtIndex(self, index):
         """Remove a child at an index of the children list.
@@ -117,7 +123,14 @@ class Hdf5Node(object):
         :raises: IndexError if list is empty or index is out of range.
         """
         self.__initChild()
-        return self.__child.pop(index)
+        child = self.__child.pop(index)
+        if self.__childIndex is not None:
+            if self.__childIndex.get(child) == len(self.__child):
+                # The last child was removed, other rows are still valid
+                del self.__childIndex[child]
+            else:
+                self.__childIndex = None
+        return child
 
     def insertChild(self, index, child):
         """
@@ -130,6 +143,12 @@ class Hdf5Node(object):
         """
         self.__initChild()
         self.__child.insert(index, child)
+        if self.__childIndex is not None:
+            if self.__child[-1] is child:
+                # Inserted at the end, other rows are still valid
+                self.__childIndex[child] = len(self.__child) - 1
+            else:
+                self.__childIndex = None
 
     def indexOfChild(self, child):
         """
@@ -139,7 +158,13 @@ class Hdf5Node(object):
         :raises: ValueError if the value is not present.
         """
         self.__initChild()
-        return self.__child.index(child)
+        if self.__childIndex is None:
+            # Lazy (re)build of the mapping after a structural change
+            self.__childIndex = {c: i for i, c in enumerate(self.__child)}
+        try:
+            return self.__childIndex[child]
+        except KeyError:
+            raise ValueError("Node is not a child of this node")
 
     def hasChildren(self):
         """Returns true if the node contains children.
@@ -67,26 +67,56 @@ def _createRootLabel(h5obj):
     return label
 
 
+class _LoadingItemSignals(qt.QObject):
+    """Signal holder for :class:`LoadingItemRunnable`"""
+    itemReady = qt.Signal(object, object, object)
+    runnerFinished = qt.Signal(object)
+
+
 class LoadingItemRunnable(qt.QRunnable):
-    """Runner to process item loading from a file"""
+    """Runner to process item loading from one or many files.
 
-    class __Signals(qt.QObject):
-        """Signal holder"""
-        itemReady = qt.Signal(object, object, object)
-        runnerFinished = qt.Signal(object)
+    The files are loaded one after the other, and `itemReady` is emitted
+    for each of them.
+    """
 
     def __init__(self, filename, item):
         """Constructor
 
-        :param LoadingItemWorker worker: Object holding data and signals
+        :param str filename: Name of the first file to load
+        :param Hdf5Node item: Item displayed while this file is loading
         """
         super(LoadingItemRunnable, self).__init__()
-        self.filename = filename
-        self.oldItem = item
-        self.signals = self.__Signals()
+        self.__files = [(filename, item)]
+        self.__cancelled = set([])
+        self.signals = _LoadingItemSignals()
+
+    @property
+    def filename(self):
+        """Name of the first file to load"""
+        return self.__files[0][0]
+
+    @property
+    def oldItem(self):
+        """Item displayed while the first file is loading"""
+        return self.__files[0][1]
 
     def setFile(self, filename, item):
-        self.filenames.append((filename, item))
+        """Add a file to load by this runner.
+
+        It have to be called before starting the runner.
+
+        :param str filename: Name of the file to load
+        :param Hdf5Node item: Item displayed while this file is loading
+        """
+        self.__files.append((filename, item))
+
+    def items(self):
+        """Returns the items displayed while the files are loading.
+
+        :rtype: List[Hdf5Node]
+        """
+        return [item for _, item in self.__files]
 
     @property
     def itemReady(self):
@@ -96,6 +126,31 @@ class LoadingItemRunnable(qt.QRunnable):
     def runnerFinished(self):
         return self.signals.runnerFinished
 
+    def cancel(self, item=None):
+        """Request the loading to be cancelled.
+
+        The loaded item is then not provided with `itemReady`, while
+        `runnerFinished` is still emitted.
+
+        :param Hdf5Node item: Only cancel the loading replacing this item.
+            By default, all the loadings of this runner are cancelled.
+        """
+        if item is None:
+            self.__cancelled.update(self.items())
+        else:
+            self.__cancelled.add(item)
+
+    def isCancelled(self, item=None):
+        """Returns true if the loading was cancelled.
+
+        :param Hdf5Node item: Only check the loading replacing this item.
+            By default, returns true if all the loadings were cancelled.
+        :rtype: bool
+        """
+        if item is None:
+            return all(i in self.__cancelled for i in self.items())
+        return item in self.__cancelled
+
     def __loadItemTree(self, oldItem, h5obj):
         """Create an item tree used by the GUI from an h5py object.
 
@@ -104,6 +159,8 @@ class LoadingItemRunnable(qt.QRunnable):
         :rtpye: Hdf5Node
         """
         text = _createRootLabel(h5obj)
+        # Only the direct children of the root are populated here, outside
+        # of the GUI thread. Deeper levels are loaded on demand by the view.
         item = Hdf5Item(
             text=text,
             obj=h5obj,
@@ -113,14 +170,15 @@ class LoadingItemRunnable(qt.QRunnable):
         )
         return item
 
-    def run(self):
-        """Process the file loading. The worker is used as holder
-        of the data and the signal. The result is sent as a signal.
-        """
+    def __loadFile(self, filename, oldItem):
+        """Load a file and send the result with `itemReady`."""
+        if self.isCancelled(oldItem):
+            return
+
         h5file = None
         try:
-            h5file = silx_io.open(self.filename)
-            newItem = self.__loadItemTree(self.oldItem, h5file)
+            h5file = silx_io.open(filename)
+            newItem = self.__loadItemTree(oldItem, h5file)
             error = None
         except IOError as e:
             # Should be logged
@@ -129,7 +187,18 @@ class LoadingItemRunnable(qt.QRunnable):
             if h5file is not None:
                 h5file.close()
 
-        self.itemReady.emit(self.oldItem, newItem, error)
+        if self.isCancelled(oldItem):
+            if newItem is not None:
+                newItem.obj.close()
+        else:
+            self.itemReady.emit(oldItem, newItem, error)
+
+    def run(self):
+        """Process the file loading. The worker is used as holder
+        of the data and the signal. The result is sent as a signal.
+        """
+        for filename, oldItem in self.__files:
+            self.__loadFile(filename, oldItem)
         self.runnerFinished.emit(self)
 
     def autoDelete(self):
@@ -184,6 +253,29 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
     ]
     """List of logical columns available"""
 
+    _COLUMN_DATA_METHODS = {
+        NAME_COLUMN: "dataName",
+        TYPE_COLUMN: "dataType",
+        SHAPE_COLUMN: "dataShape",
+        VALUE_COLUMN: "dataValue",
+        DESCRIPTION_COLUMN: "dataDescription",
+        NODE_COLUMN: "dataNode",
+        LINK_COLUMN: "dataLink",
+    }
+    """Mapping from column id to the node method providing its data"""
+
+    _NODE_DATA_ROLES = (
+        qt.Qt.DisplayRole,
+        qt.Qt.DecorationRole,
+        qt.Qt.TextAlignmentRole,
+        qt.Qt.ToolTipRole,
+    )
+    """Roles which can be provided by the nodes
+
+    A tuple is used to compare roles by equality, as the role can be
+    provided either as an int or as an enum depending on the Qt binding.
+    """
+
     sigH5pyObjectLoaded = qt.Signal(object)
     """Emitted when a new root item was loaded and inserted to the model."""
 
@@ -221,6 +313,7 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         self.__animatedIcon = icons.getWaitIcon()
         self.__animatedIcon.iconChanged.connect(self.__updateLoadingItems)
         self.__runnerSet = set([])
+        self.__loadingItems = set([])
 
         # store used icons to avoid the cache to release it
         self.__icons = []
@@ -262,12 +355,19 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         self._closeFileList(self.__openedFiles)
 
     def __updateLoadingItems(self, icon):
-        for i in range(self.__root.childCount()):
-            item = self.__root.child(i)
-            if isinstance(item, Hdf5LoadingItem):
-                index1 = self.index(i, 0, qt.QModelIndex())
-                index2 = self.index(i, self.columnCount() - 1, qt.QModelIndex())
-                self.dataChanged.emit(index1, index2)
+        if len(self.__loadingItems) == 0:
+            # The icon can be animated for other widgets
+            return
+        rows = [self.__root.indexOfChild(item) for item in self.__loadingItems]
+        index1 = self.index(min(rows), 0, qt.QModelIndex())
+        index2 = self.index(max(rows), self.columnCount() - 1, qt.QModelIndex())
+        self.dataChanged.emit(index1, index2)
+
+    def __releaseLoadingItem(self, item):
+        """Stop to animate a loading item removed from the model"""
+        if item in self.__loadingItems:
+            self.__loadingItems.remove(item)
+            self.__animatedIcon.unregister(item)
 
     def __itemReady(self, oldItem, newItem, error):
         """Called at the end of a concurent file loading, when the loading
@@ -278,12 +378,21 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         :param Hdf5Node newItem: item loaded, or None if error is defined
         :param Exception error: An exception, or None if newItem is defined
         """
-        row = self.__root.indexOfChild(oldItem)
+        try:
+            row = self.__root.indexOfChild(oldItem)
+        except ValueError:
+            # The loading item was removed while the signal was queued
+            row = None
+        if row is None or self.__isLoadingCancelled(oldItem):
+            if newItem is not None:
+                newItem.obj.close()
+            return
 
         rootIndex = qt.QModelIndex()
         self.beginRemoveRows(rootIndex, row, row)
         self.__root.removeChildAtIndex(row)
         self.endRemoveRows()
+        self.__releaseLoadingItem(oldItem)
 
         if newItem is not None:
             rootIndex = qt.QModelIndex()
@@ -419,12 +528,15 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
                     row = self.__root.childCount()
 
             messages = []
+            filenames = []
             for url in mimedata.urls():
-                try:
-                    self.insertFileAsync(url.toLocalFile(), row)
-                    row += 1
-                except IOError as e:
-                    messages.append(e.args[0])
+                filename = url.toLocalFile()
+                if os.path.isfile(filename):
+                    filenames.append(filename)
+                else:
+                    messages.append("Filename '%s' must be a file path" % filename)
+            if filenames:
+                self.insertFilesAsync(filenames, row)
             if len(messages) > 0:
                 title = "Error occurred when loading files"
                 message = "<html>%s:<ul><li>%s</li><ul></html>" % (title, "</li><li>".join(messages))
@@ -447,23 +559,23 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         self.endInsertRows()
 
     def moveRow(self, sourceParentIndex, sourceRow, destinationParentIndex, destinationRow):
-        if sourceRow == destinationRow or sourceRow == destinationRow - 1:
-            # abort move, same place
-            return
+        if sourceParentIndex == destinationParentIndex:
+            if sourceRow == destinationRow or sourceRow == destinationRow - 1:
+                # abort move, same place
+                return
         return self.moveRows(sourceParentIndex, sourceRow, 1, destinationParentIndex, destinationRow)
 
     def moveRows(self, sourceParentIndex, sourceRow, count, destinationParentIndex, destinationRow):
-        self.beginMoveRows(sourceParentIndex, sourceRow, sourceRow, destinationParentIndex, destinationRow)
+        if not self.beginMoveRows(sourceParentIndex, sourceRow, sourceRow, destinationParentIndex, destinationRow):
+            return False
         sourceNode = self.nodeFromIndex(sourceParentIndex)
         destinationNode = self.nodeFromIndex(destinationParentIndex)
 
+        item = sourceNode.removeChildAtIndex(sourceRow)
         if sourceNode is destinationNode and sourceRow < destinationRow:
-            item = sourceNode.child(sourceRow)
-            destinationNode.insertChild(destinationRow, item)
-            sourceNode.removeChildAtIndex(sourceRow)
-        else:
-            item = sourceNode.removeChildAtIndex(sourceRow)
-            destinationNode.insertChild(destinationRow, item)
+            # The removal shifted the destination row
+            destinationRow -= 1
+        destinationNode.insertChild(destinationRow, item)
 
         self.endMoveRows()
         return True
@@ -484,22 +596,13 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         if role == self.H5PY_OBJECT_ROLE:
             return node.obj
 
-        if index.column() == self.NAME_COLUMN:
-            return node.dataName(role)
-        elif index.column() == self.TYPE_COLUMN:
-            return node.dataType(role)
-        elif index.column() == self.SHAPE_COLUMN:
-            return node.dataShape(role)
-        elif index.column() == self.VALUE_COLUMN:
-            return node.dataValue(role)
-        elif index.column() == self.DESCRIPTION_COLUMN:
-            return node.dataDescription(role)
-        elif index.column() == self.NODE_COLUMN:
-            return node.dataNode(role)
-        elif index.column() == self.LINK_COLUMN:
-            return node.dataLink(role)
-        else:
+        if role not in self._NODE_DATA_ROLES:
+            return None
+
+        method = self._COLUMN_DATA_METHODS.get(index.column())
+        if method is None:
             return None
+        return getattr(node, method)(role)
 
     def columnCount(self, parent=qt.QModelIndex()):
         return len(self.COLUMN_IDS)
@@ -534,8 +637,6 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         if grandparent is None:
             return qt.QModelIndex()
         row = grandparent.indexOfChild(parent)
-
-        assert row != - 1
         return self.createIndex(row, 0, parent)
 
     def nodeFromIndex(self, index):
@@ -617,9 +718,11 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         if node.parent != self.__root:
             return
         self._closeFileIfOwned(node)
+        self.__cancelRunners(node)
         self.beginRemoveRows(qt.QModelIndex(), index.row(), index.row())
         self.__root.removeChildAtIndex(index.row())
         self.endRemoveRows()
+        self.__releaseLoadingItem(node)
         self.sigH5pyObjectRemoved.emit(node.obj)
 
     def removeH5pyObject(self, h5pyObject):
@@ -673,24 +776,78 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
 
         # create temporary item
         if synchronizingNode is None:
-            text = os.path.basename(filename)
-            item = Hdf5LoadingItem(
-                text=text,
-                parent=self.__root,
-                animatedIcon=self.__animatedIcon,
-                openedPath=filename,
-            )
+            item = self.__createLoadingItem(filename)
             self.insertNode(row, item)
+            self.__loadingItems.add(item)
         else:
             item = synchronizingNode
 
         # start loading the real one
         runnable = LoadingItemRunnable(filename, item)
+        self.__startRunner(runnable)
+
+    def insertFilesAsync(self, filenames, row=-1):
+        """Load many files into the data model, in a single background task.
+
+        A loading item is displayed for each file until it is loaded.
+
+        :param List[str] filenames: List of file paths
+        :param int row: Row of the first file, by default the files are
+            appended at the end of the model
+        :raises IOError: If one of the filenames is not a file. Then nothing
+            is loaded.
+        """
+        for filename in filenames:
+            if not os.path.isfile(filename):
+                raise IOError("Filename '%s' must be a file path" % filename)
+        if len(filenames) == 0:
+            return
+
+        if row == -1:
+            row = self.__root.childCount()
+        items = [self.__createLoadingItem(filename) for filename in filenames]
+
+        self.beginInsertRows(qt.QModelIndex(), row, row + len(items) - 1)
+        for i, item in enumerate(items):
+            self.__root.insertChild(row + i, item)
+        self.endInsertRows()
+        self.__loadingItems.update(items)
+
+        runnable = LoadingItemRunnable(filenames[0], items[0])
+        for filename, item in zip(filenames[1:], items[1:]):
+            runnable.setFile(filename, item)
+        self.__startRunner(runnable)
+
+    def __createLoadingItem(self, filename):
+        """Returns an item displayed while a file is loading"""
+        return Hdf5LoadingItem(
+            text=os.path.basename(filename),
+            parent=self.__root,
+            animatedIcon=self.__animatedIcon,
+            openedPath=filename,
+        )
+
+    def __startRunner(self, runnable):
+        """Start a file loading in the global thread pool"""
         runnable.itemReady.connect(self.__itemReady)
         runnable.runnerFinished.connect(self.__releaseRunner)
         self.__runnerSet.add(runnable)
         qt.silxGlobalThreadPool().start(runnable)
 
+    def __cancelRunners(self, node):
+        """Cancel the pending loadings which will replace this node"""
+        for runner in self.__runnerSet:
+            if node in runner.items():
+                runner.cancel(node)
+
+    def __isLoadingCancelled(self, node):
+        """Returns true if a pending loading which replaces this node was
+        cancelled"""
+        for runner in self.__runnerSet:
+            if node in runner.items() and runner.isCancelled(node):
+                return True
+        return False
+
     def __releaseRunner(self, runner):
         self.__runnerSet.remove(runner)
 
@@ -115,11 +115,11 @@ class Hdf5TreeView(qt.QTreeView):
         hovered_object = _utils.H5Node(hovered_node)
         event = _utils.Hdf5ContextMenuEvent(self, menu, hovered_object)
 
-        for callback in self.__context_menu_callbacks:
+        # Callbacks can register/unregister callbacks while being called
+        callbacks = list(self.__context_menu_callbacks)
+        for callback in callbacks:
             try:
                 callback(event)
-            except KeyboardInterrupt:
-                raise
             except Exception:
                 # make sure no user callback crash the application
                 _logger.error("Error while calling callback", exc_info=True)
@@ -189,10 +189,12 @@ class Hdf5TreeView(qt.QTreeView):
             broken links.
         :rtype: iterator(:class:`_utils.H5Node`)
         """
+        model = self.model()
+        # Not selectedRows(): rows can be partially selected programmatically
         for index in self.selectedIndexes():
             if index.column() != 0:
                 continue
-            item = self.model().data(index, Hdf5TreeModel.H5PY_ITEM_ROLE)
+            item = model.data(index, Hdf5TreeModel.H5PY_ITEM_ROLE)
             if item is None:
                 continue
             if isinstance(item, Hdf5Item):
@@ -258,6 +260,37 @@ class Hdf5TreeView(qt.QTreeView):
                 i = i.parent()
             self.setCurrentIndex(index)
 
+    def expandAllFast(self, collapsedH5Objects=(), depth=4):
+        """Expand the items of the tree at once, down to a given depth,
+        then collapse the requested nodes.
+
+        This is faster than expanding the items one by one, as the view is
+        only laid out and repainted once.
+
+        The expansion is always limited in depth: HDF5 hard links can loop
+        back to a parent group, so the tree is not necessarily finite, and
+        each expanded level loads the children of its groups.
+
+        :param collapsedH5Objects: h5py-like objects which have to stay
+            collapsed
+        :param int depth: Number of levels expanded below the root items.
+            0 only expands the root items.
+        """
+        model = self.findHdf5TreeModel()
+        updatesEnabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        wasBlocked = self.blockSignals(True)
+        try:
+            self.expandToDepth(depth)
+            if model is not None:
+                for h5Object in collapsedH5Objects:
+                    index = self.mapToModel(model.indexFromH5Object(h5Object))
+                    if index.isValid():
+                        self.collapse(index)
+        finally:
+            self.blockSignals(wasBlocked)
+            self.setUpdatesEnabled(updatesEnabled)
+
     def mousePressEvent(self, event):
         """Override mousePressEvent to provide a consistante compatible API
         between Qt4 and Qt5
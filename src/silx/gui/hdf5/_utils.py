@@ -85,7 +85,7 @@ def htmlFromDict(dictionary, title=None):
     :param dict dictionary: A Dictionary
     :rtype: str
     """
-    result = """<html>
+    result = ["""<html>
         <head>
         <style type="text/css">
         ul { -qt-list-indent: 0; list-style: none; }
@@ -93,15 +93,17 @@ def htmlFromDict(dictionary, title=None):
         </style>
         </head>
         <body>
-        """
+        """]
     if title is not None:
-        result += "<b>%s</b>" % escape(title)
-    result += "<ul>"
-    for key, value in dictionary.items():
-        result += "<li><b>%s</b>: %s</li>" % (escape(key), escape(value))
-    result += "</ul>"
-    result += "</body></html>"
-    return result
+        result.append("<b>%s</b>" % escape(title))
+    result.append("<ul>")
+    result.extend(
+        "<li><b>%s</b>: %s</li>" % (escape(key), escape(value))
+        for key, value in dictionary.items()
+    )
+    result.append("</ul>")
+    result.append("</body></html>")
+    return "".join(result)
 
 
 class Hdf5DatasetMimeData(qt.QMimeData):
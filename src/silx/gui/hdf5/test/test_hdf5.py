@@ -40,6 +40,7 @@ from silx.gui import hdf5
 from silx.gui.utils.testutils import SignalListener
 from silx.io import commonh5
 import weakref
+from unittest import mock
 
 import h5py
 import pytest
@@ -142,6 +143,67 @@ class TestHdf5TreeModel(TestCaseQt):
             model = None
             self.qWaitForDestroy(ref)
 
+    def testInsertFilenamesAsync(self):
+        try:
+            model = hdf5.Hdf5TreeModel()
+            model.insertFilesAsync([self.filename, self.filename])
+            self.assertEqual(model.rowCount(qt.QModelIndex()), 2)
+            self.waitForPendingOperations(model)
+            for row in range(2):
+                index = model.index(row, 0, qt.QModelIndex())
+                self.assertIsInstance(model.nodeFromIndex(index), hdf5.Hdf5Item.Hdf5Item)
+        finally:
+            ref = weakref.ref(model)
+            model = None
+            self.qWaitForDestroy(ref)
+
+    def testRemoveLoadingItem(self):
+        try:
+            model = hdf5.Hdf5TreeModel()
+            listener = SignalListener()
+            model.sigH5pyObjectLoaded.connect(listener)
+            model.insertFileAsync(self.filename)
+            # Let the loading end, without processing the queued result
+            qt.silxGlobalThreadPool().waitForDone()
+            model.removeIndex(model.index(0, 0, qt.QModelIndex()))
+            self.waitForPendingOperations(model)
+            self.assertEqual(model.rowCount(qt.QModelIndex()), 0)
+            self.assertEqual(listener.callCount(), 0)
+        finally:
+            ref = weakref.ref(model)
+            model = None
+            self.qWaitForDestroy(ref)
+
+    def testInsertFilenameAsyncIsLazy(self):
+        populated = []
+        populateChild = hdf5.Hdf5Item.Hdf5Item._populateChild
+
+        def populateChildSpy(item, *args, **kwargs):
+            populated.append(item.obj.name)
+            return populateChild(item, *args, **kwargs)
+
+        try:
+            model = hdf5.Hdf5TreeModel()
+            with mock.patch.object(hdf5.Hdf5Item.Hdf5Item, "_populateChild",
+                                   populateChildSpy):
+                model.insertFileAsync(self.filename)
+                self.waitForPendingOperations(model)
+                # The first level is populated by the loader
+                self.assertEqual(populated, ["/"])
+                index = model.index(0, 0, qt.QModelIndex())
+                node = model.nodeFromIndex(index)
+                # Deeper levels are not, their size is known without loading
+                group = node.child(0)
+                self.assertEqual(group.childCount(), 1)
+                self.assertEqual(populated, ["/"])
+                # They are loaded on demand
+                self.assertEqual(group.child(0).obj.name, "/arrays/scalar")
+                self.assertEqual(populated, ["/", "/arrays"])
+        finally:
+            ref = weakref.ref(model)
+            model = None
+            self.qWaitForDestroy(ref)
+
     def testInsertObject(self):
         h5 = commonh5.File("/foo/bar/1.mock", "w")
         model = hdf5.Hdf5TreeModel()
@@ -970,6 +1032,21 @@ class TestHdf5TreeView(TestCaseQt):
         selected = list(view.selectedH5Nodes())[0]
         self.assertIs(item, selected.h5py_object)
 
+    def testSelection_SingleCell(self):
+        tree = commonh5.File("/foo/bar/1.mock", "w")
+        item = tree.create_group("a")
+
+        model = hdf5.Hdf5TreeModel()
+        model.insertH5pyObject(tree)
+        view = hdf5.Hdf5TreeView()
+        view.setModel(model)
+        index = model.index(0, 0, model.index(0, 0, qt.QModelIndex()))
+        view.selectionModel().select(index, qt.QItemSelectionModel.Select)
+
+        selected = list(view.selectedH5Nodes())
+        self.assertEqual(len(selected), 1)
+        self.assertIs(item, selected[0].h5py_object)
+
     def testSelection_NotFound(self):
         tree2 = commonh5.File("/foo/bar/2.mock", "w")
         tree = commonh5.File("/foo/bar/1.mock", "w")
@@ -1088,3 +1165,44 @@ class TestHdf5TreeView(TestCaseQt):
 
         selection = list(view.selectedH5Nodes())
         self.assertEqual(len(selection), 0)
+
+    def testExpandAllFast(self):
+        tree = commonh5.File("/foo/bar/1.mock", "w")
+        tree.create_group("a/b")
+        collapsed = tree.create_group("c")
+        collapsed.create_group("d")
+
+        model = hdf5.Hdf5TreeModel()
+        model.insertH5pyObject(tree)
+        view = hdf5.Hdf5TreeView()
+        view.setModel(model)
+        view.expandAllFast(collapsedH5Objects=[collapsed])
+
+        self.assertTrue(view.isExpanded(model.indexFromH5Object(tree)))
+        self.assertTrue(view.isExpanded(model.indexFromH5Object(tree["a"])))
+        self.assertFalse(view.isExpanded(model.indexFromH5Object(collapsed)))
+
+    def testExpandAllFastRecursiveLink(self):
+        with h5py.File("loop.h5", "w", driver="core", backing_store=False) as h5:
+            group = h5.create_group("a")
+            group["loop"] = group  # hard link to its parent group
+            model = hdf5.Hdf5TreeModel()
+            model.insertH5pyObject(h5)
+            view = hdf5.Hdf5TreeView()
+            view.setModel(model)
+            view.expandAllFast(depth=2)
+
+            root = model.index(0, 0, qt.QModelIndex())
+            a = model.index(0, 0, root)
+            loop = model.index(0, 0, a)
+            self.assertTrue(view.isExpanded(a))
+            self.assertTrue(view.isExpanded(loop))
+            self.assertFalse(view.isExpanded(model.index(0, 0, loop)))
+            view = None
+            model = None
+
+    def testExpandAllFastWithoutHdf5Model(self):
+        tree = commonh5.File("/foo/bar/1.mock", "w")
+        view = hdf5.Hdf5TreeView()
+        view.setModel(qt.QStandardItemModel())
+        view.expandAllFast(collapsedH5Objects=[tree])
@@ -366,6 +366,7 @@ class PlotWidget(qt.QMainWindow):
     def __init__(self, parent=None, backend=None):
         self._autoreplot = False
         self._dirty = False
+        self._dirtyCount = 0
         self._cursorInPlot = False
         self.__muteActiveItemChanged = False
 
@@ -648,6 +649,15 @@ class PlotWidget(qt.QMainWindow):
         """
         return self._dirty
 
+    def _getDirtyCount(self):
+        """Return the number of times the plot was marked as needing redraw.
+
+        It can be used to check if the plot has changed since a given time.
+
+        :rtype: int
+        """
+        return self._dirtyCount
+
     # Default Qt context menu
 
     def contextMenuEvent(self, event):
@@ -678,6 +688,7 @@ class PlotWidget(qt.QMainWindow):
                                  False to redraw everything
         """
         wasDirty = self._dirty
+        self._dirtyCount += 1
 
         if not self._dirty and overlayOnly:
             self._dirty = 'overlay'
@@ -3046,7 +3057,8 @@ class PlotWidget(qt.QMainWindow):
         The matplotlib backend supports more formats:
         "pdf", "ps", "eps", "tiff", "jpeg", "jpg".
 
-        :param filename: Destination
+        :param filename: Destination. SVG can be written to either a text
+            (StringIO) or a binary (BytesIO) file-like object.
         :type filename: str, StringIO or BytesIO
         :param str fileFormat:  String specifying the format
         :return: False if cannot save the plot, True otherwise
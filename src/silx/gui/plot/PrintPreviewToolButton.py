@@ -102,7 +102,7 @@ plots on the same page. The plots all instantiate a
 """
 
 import logging
-from io import StringIO
+from io import BytesIO
 
 from .. import qt
 from .. import icons
@@ -117,6 +117,16 @@ __date__ = "20/12/2018"
 _logger = logging.getLogger(__name__)
 # _logger.setLevel(logging.DEBUG)
 
+_INCHES_PER_UNIT = {
+    "inch": 1.,
+    "inches": 1.,
+    "cm": 1. / 2.54,
+    "centimeters": 1. / 2.54,
+}
+"""Conversion factors from the print geometry units to inches.
+
+Other units are fractions of the page."""
+
 
 class PrintPreviewToolButton(qt.QToolButton):
     """QToolButton to open a :class:`PrintPreviewDialog` (if not already open)
@@ -153,6 +163,9 @@ class PrintPreviewToolButton(qt.QToolButton):
 
         self._printPreviewDialog = None
         self._printConfigurationDialog = None
+        self._svgCache = None
+        """Last SVG snapshot of the plot, stored with the plot state
+        it was generated from"""
 
         self._printGeometry = {"xOffset": 0.1,
                                "yOffset": 0.1,
@@ -213,7 +226,7 @@ class PrintPreviewToolButton(qt.QToolButton):
                                                keepRatio=self._printGeometry["keepAspectRatio"])
         else:
             _logger.warning("Missing QtSvg library, using a raster image")
-            pixmap = self._plot.centralWidget().grab()
+            pixmap = self._getPixmap()
             self.printPreviewDialog.addPixmap(pixmap,
                                               title=self.getTitle(),
                                               comment=comment,
@@ -228,12 +241,7 @@ class PrintPreviewToolButton(qt.QToolButton):
         The size of the renderer is adjusted to the printer configuration
         and to the geometry configuration (width, height, ratio) specified
         by the user."""
-        imgData = StringIO()
-        assert self._plot.saveGraph(imgData, fileFormat="svg"), \
-            "Unable to save graph"
-        imgData.flush()
-        imgData.seek(0)
-        svgData = imgData.read()
+        svgData = self._getSvgData()
 
         svgRenderer = qt.QSvgRenderer()
 
@@ -241,18 +249,64 @@ class PrintPreviewToolButton(qt.QToolButton):
 
         svgRenderer.setViewBox(viewbox)
 
-        xml_stream = qt.QXmlStreamReader(svgData.encode(errors="replace"))
+        rendererData = qt.QByteArray(svgData)
 
         # This is for PyMca compatibility, to share a print preview with PyMca plots
         svgRenderer._viewBox = viewbox
-        svgRenderer._svgRawData = svgData.encode(errors="replace")
-        svgRenderer._svgRendererData = xml_stream
+        svgRenderer._svgRawData = svgData
+        svgRenderer._svgRendererData = rendererData
 
-        if not svgRenderer.load(xml_stream):
+        if not svgRenderer.load(rendererData):
             raise RuntimeError("Cannot interpret svg data")
 
         return svgRenderer, viewbox
 
+    def _getPixmap(self):
+        """Return a raster image of the plot.
+
+        The image is downscaled if it is larger than the geometry
+        configuration specified by the user, which defines its printed size.
+
+        :rtype: qt.QPixmap
+        """
+        pixmap = self._plot.centralWidget().grab()
+        targetSize = self._getViewBox().size().toSize()
+        if (pixmap.width() > targetSize.width() or
+                pixmap.height() > targetSize.height()):
+            pixmap = pixmap.scaled(targetSize,
+                                   qt.Qt.KeepAspectRatio,
+                                   qt.Qt.SmoothTransformation)
+        return pixmap
+
+    def _getPlotState(self):
+        """Returns a key which changes when the rendering of the plot changes.
+
+        :rtype: tuple
+        """
+        widget = self._plot.centralWidget()
+        return self._plot._getDirtyCount(), widget.width(), widget.height()
+
+    def _getSvgData(self):
+        """Returns a cached version of the SVG snapshot of the plot.
+
+        The snapshot is only generated again if the plot was changed since
+        the last call.
+
+        :rtype: bytes
+        """
+        if self._svgCache is not None:
+            plotState, svgData = self._svgCache
+            if plotState == self._getPlotState():
+                return svgData
+
+        imgData = BytesIO()
+        assert self._plot.saveGraph(imgData, fileFormat="svg"), \
+            "Unable to save graph"
+        svgData = imgData.getvalue()
+        # Saving the graph can mark the plot as dirty: get the state after it
+        self._svgCache = self._getPlotState(), svgData
+        return svgData
+
     def _getViewBox(self):
         """
         """
@@ -272,28 +326,18 @@ class PrintPreviewToolButton(qt.QToolButton):
         aspectRatio = self._getPlotAspectRatio()
 
         # convert the offsets to dots
-        if units.lower() in ['inch', 'inches']:
-            xOffset = xOffset * dpix
-            yOffset = yOffset * dpiy
-            if width is not None:
-                width = width * dpix
-            if height is not None:
-                height = height * dpiy
-        elif units.lower() in ['cm', 'centimeters']:
-            xOffset = (xOffset / 2.54) * dpix
-            yOffset = (yOffset / 2.54) * dpiy
-            if width is not None:
-                width = (width / 2.54) * dpix
-            if height is not None:
-                height = (height / 2.54) * dpiy
-        else:
+        inchesPerUnit = _INCHES_PER_UNIT.get(units.lower())
+        if inchesPerUnit is None:
             # page units
-            xOffset = availableWidth * xOffset
-            yOffset = availableHeight * yOffset
-            if width is not None:
-                width = availableWidth * width
-            if height is not None:
-                height = availableHeight * height
+            xScale, yScale = availableWidth, availableHeight
+        else:
+            xScale, yScale = inchesPerUnit * dpix, inchesPerUnit * dpiy
+        xOffset = xOffset * xScale
+        yOffset = yOffset * yScale
+        if width is not None:
+            width = width * xScale
+        if height is not None:
+            height = height * yScale
 
         availableWidth -= xOffset
         availableHeight -= yOffset
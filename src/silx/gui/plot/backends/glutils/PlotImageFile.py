@@ -29,6 +29,7 @@ __date__ = "03/04/2017"
 
 
 import base64
+import io
 import struct
 import zlib
 
@@ -86,6 +87,7 @@ def saveImageToFile(data, fileNameOrObj, fileFormat):
     :type data: numpy.ndarray with of unsigned bytes.
     :param fileNameOrObj: Filename or object to use to write the image.
     :type fileNameOrObj: A str or a 'file-like' object with a 'write' method.
+        SVG is written as bytes to binary file-like objects (e.g., BytesIO).
     :param str fileFormat: The type of the file in: 'png', 'ppm', 'svg', 'tiff'.
     """
     assert len(data.shape) == 3
@@ -105,25 +107,29 @@ def saveImageToFile(data, fileNameOrObj, fileFormat):
         height, width = data.shape[:2]
         base64Data = base64.b64encode(convertRGBDataToPNG(data))
 
-        fileObj.write(
-            '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n')
-        fileObj.write('<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN"\n')
-        fileObj.write(
-            '  "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">\n')
-        fileObj.write('<svg xmlns:xlink="http://www.w3.org/1999/xlink"\n')
-        fileObj.write('     xmlns="http://www.w3.org/2000/svg"\n')
-        fileObj.write('     version="1.1"\n')
-        fileObj.write('     width="%d"\n' % width)
-        fileObj.write('     height="%d">\n' % height)
-        fileObj.write('    <image xlink:href="data:image/png;base64,')
-        fileObj.write(base64Data.decode('ascii'))
-        fileObj.write('"\n')
-        fileObj.write('           x="0"\n')
-        fileObj.write('           y="0"\n')
-        fileObj.write('           width="%d"\n' % width)
-        fileObj.write('           height="%d"\n' % height)
-        fileObj.write('           id="image" />\n')
-        fileObj.write('</svg>')
+        svgData = ''.join([
+            '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n',
+            '<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN"\n',
+            '  "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">\n',
+            '<svg xmlns:xlink="http://www.w3.org/1999/xlink"\n',
+            '     xmlns="http://www.w3.org/2000/svg"\n',
+            '     version="1.1"\n',
+            '     width="%d"\n' % width,
+            '     height="%d">\n' % height,
+            '    <image xlink:href="data:image/png;base64,',
+            base64Data.decode('ascii'),
+            '"\n',
+            '           x="0"\n',
+            '           y="0"\n',
+            '           width="%d"\n' % width,
+            '           height="%d"\n' % height,
+            '           id="image" />\n',
+            '</svg>',
+        ])
+        if isinstance(fileObj, (io.RawIOBase, io.BufferedIOBase)):
+            # Binary file-like object
+            svgData = svgData.encode('ascii')
+        fileObj.write(svgData)
 
     elif fileFormat == 'ppm':
         height, width = data.shape[:2]
@@ -36,10 +36,13 @@ class FloatEdit(qt.QLineEdit):
 
     :param parent: See :class:`QLineEdit`
     :param float value: The value to set the QLineEdit to.
+    :param qt.QDoubleValidator validator: Validator of the field, which can
+        be shared with other fields. By default, a new one is created.
     """
-    def __init__(self, parent=None, value=None):
+    def __init__(self, parent=None, value=None, validator=None):
         qt.QLineEdit.__init__(self, parent)
-        validator = qt.QDoubleValidator(self)
+        if validator is None:
+            validator = qt.QDoubleValidator(self)
         self.setValidator(validator)
         self.setAlignment(qt.Qt.AlignRight)
         if value is not None:
@@ -59,10 +62,9 @@ class FloatEdit(qt.QLineEdit):
         :param float value: The value to set the QLineEdit to.
         """
         locale = self.validator().locale()
-        if qt.BINDING == "PySide6":
-            # Fix for PySide6 not selecting the right method
-            text = locale.toString(float(value), 'g')
-        else:
-            text = locale.toString(float(value))
+        # Shortest text which reads back as the same float
+        text = locale.toString(
+            float(value), 'g', qt.QLocale.FloatingPointShortest)
 
-        self.setText(text)
+        if text != self.text():
+            self.setText(text)
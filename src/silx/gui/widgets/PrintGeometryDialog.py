@@ -66,32 +66,35 @@ class PrintGeometryWidget(qt.QWidget):
         self.mainLayout.addWidget(hbox, 1, 0, 1, 4)
         self._pageButton.setChecked(True)
 
+        # Validator shared by the fields
+        validator = qt.QDoubleValidator(self)
+
         # xOffset
         label = qt.QLabel(self)
         label.setText("X Offset:")
         self.mainLayout.addWidget(label, 2, 0)
-        self._xOffset = FloatEdit(self, 0.1)
+        self._xOffset = FloatEdit(self, 0.1, validator)
         self.mainLayout.addWidget(self._xOffset, 2, 1)
 
         # yOffset
         label = qt.QLabel(self)
         label.setText("Y Offset:")
         self.mainLayout.addWidget(label, 2, 2)
-        self._yOffset = FloatEdit(self, 0.1)
+        self._yOffset = FloatEdit(self, 0.1, validator)
         self.mainLayout.addWidget(self._yOffset, 2, 3)
 
         # width
         label = qt.QLabel(self)
         label.setText("Width:")
         self.mainLayout.addWidget(label, 3, 0)
-        self._width = FloatEdit(self, 0.9)
+        self._width = FloatEdit(self, 0.9, validator)
         self.mainLayout.addWidget(self._width, 3, 1)
 
         # height
         label = qt.QLabel(self)
         label.setText("Height:")
         self.mainLayout.addWidget(label, 3, 2)
-        self._height = FloatEdit(self, 0.9)
+        self._height = FloatEdit(self, 0.9, validator)
         self.mainLayout.addWidget(self._height, 3, 3)
 
         # aspect ratio
@@ -155,10 +158,10 @@ class PrintGeometryWidget(qt.QWidget):
         else:
             self._pageButton.setChecked(True)
 
-        self._xOffset.setText("%s" % float(geometry['xOffset']))
-        self._yOffset.setText("%s" % float(geometry['yOffset']))
-        self._width.setText("%s" % float(geometry['width']))
-        self._height.setText("%s" % float(geometry['height']))
+        self._xOffset.setValue(geometry['xOffset'])
+        self._yOffset.setValue(geometry['yOffset'])
+        self._width.setValue(geometry['width'])
+        self._height.setValue(geometry['height'])
         if geometry['keepAspectRatio']:
             self._aspect.setChecked(True)
         else:
@@ -30,6 +30,7 @@ __date__ = "19/07/2017"
 
 from silx.gui.utils.testutils import TestCaseQt
 from silx.gui.widgets.PrintPreview import PrintPreviewDialog
+from silx.gui.widgets.PrintGeometryDialog import PrintGeometryWidget
 from silx.gui import qt
 
 from silx.resources import resource_filename
@@ -59,3 +60,16 @@ class TestPrintPreview(TestCaseQt):
         d = PrintPreviewDialog(printer=p)
         d.addPixmap(qt.QPixmap.fromImage(qt.QImage(resource_filename("gui/icons/clipboard.png"))))
         self.qapp.processEvents()
+
+
+class TestPrintGeometryWidget(TestCaseQt):
+    def testGeometryPrecision(self):
+        widget = PrintGeometryWidget()
+        geometry = {"units": "inches",
+                    "xOffset": 0.1,
+                    "yOffset": 0.25,
+                    "width": 8.26771653,
+                    "height": 11.69291339,
+                    "keepAspectRatio": True}
+        widget.setPrintGeometry(dict(geometry))
+        self.assertEqual(widget.getPrintGeometry(), geometry)
@@ -591,6 +591,7 @@ class SoftLink(Node):
 
         # attr target defined for spech5 backward compatibility
         self.target = str(path)
+        self.__link_node = None
 
     @property
     def h5_class(self):
@@ -605,6 +606,34 @@ class SoftLink(Node):
         """Soft link value. Not guaranteed to be a valid path."""
         return self.target
 
+    def _get_link_node(self):
+        """Returns a group or a dataset node providing access to the target
+        of this link.
+
+        For read-only files, the node is created once and then reused.
+
+        :raises KeyError: If the link is broken
+        :rtype: Node
+        """
+        if self.__link_node is not None:
+            return self.__link_node
+
+        target = self.file.get(self.path)
+        if target is None:
+            msg = "Unable to open object (broken SoftLink %s -> %s)"
+            raise KeyError(msg % (self.name, self.path))
+        # Convert SoftLink into typed group/dataset
+        if isinstance(target, Group):
+            node = _LinkToGroup(name=self.basename, target=target, parent=self.parent)
+        elif isinstance(target, Dataset):
+            node = _LinkToDataset(name=self.basename, target=target, parent=self.parent)
+        else:
+            raise TypeError("Unexpected target type %s" % type(target))
+
+        if not self._is_editable():
+            self.__link_node = node
+        return node
+
 
 class Group(Node):
     """This class mimics a `h5py.Group`."""
@@ -668,18 +697,7 @@ class Group(Node):
                 result = result._get_items()[item_name]
 
         if isinstance(result, SoftLink) and not getlink:
-            link = result
-            target = result.file.get(link.path)
-            if result is None:
-                msg = "Unable to open object (broken SoftLink %s -> %s)"
-                raise KeyError(msg % (link.name, link.path))
-            # Convert SoftLink into typed group/dataset
-            if isinstance(target, Group):
-                result = _LinkToGroup(name=link.basename, target=target, parent=link.parent)
-            elif isinstance(target, Dataset):
-                result = _LinkToDataset(name=link.basename, target=target, parent=link.parent)
-            else:
-                raise TypeError("Unexpected target type %s" % type(target))
+            result = result._get_link_node()
 
         return result
 
@@ -829,8 +847,7 @@ class Group(Node):
 
     def __iter__(self):
         """Iterate over member names"""
-        for x in self._get_items().__iter__():
-            yield x
+        return iter(self._get_items())
 
     def keys(self):
         """Returns an iterator over the children's names in a group."""
@@ -858,8 +875,7 @@ class Group(Node):
         :param func: Callable (function, method or callable object)
         :type func: callable
         """
-        origin_name = self.name
-        return self._visit(func, origin_name, visit_links)
+        return self._visit(func, visit_links)
 
     def visititems(self, func, visit_links=False):
         """Recursively visit names and objects in this group.
@@ -870,32 +886,36 @@ class Group(Node):
         :param bool visit_links: If *False*, ignore links. If *True*,
             call `func(name)` for links and recurse into target groups.
         """
-        origin_name = self.name
-        return self._visit(func, origin_name, visit_links,
-                           visititems=True)
+        return self._visit(func, visit_links, visititems=True)
 
-    def _visit(self, func, origin_name,
-               visit_links=False, visititems=False):
-        """
+    def _visit(self, func, visit_links=False, visititems=False):
+        """Visit members depth-first, using a stack of member iterators
+        instead of recursive calls.
 
-        :param origin_name: name of first group that initiated the recursion
-            This is used to compute the relative path from each item's
-            absolute path.
+        Relative names are built from the path prefix of each group, rather
+        than from the absolute :attr:`name` of each member, which walks up
+        to the root.
+
+        :return: The first value returned by `func` which is not None
         """
-        for member in self.values():
-            ret = None
-            if not isinstance(member, SoftLink) or visit_links:
-                relative_name = member.name[len(origin_name):]
-                # remove leading slash and unnecessary trailing slash
-                relative_name = relative_name.strip("/")
-                if visititems:
-                    ret = func(relative_name, member)
-                else:
-                    ret = func(relative_name)
-            if ret is not None:
-                return ret
-            if isinstance(member, Group):
-                member._visit(func, origin_name, visit_links, visititems)
+        stack = [("", iter(self.items()))]
+        while stack:
+            prefix, members = stack[-1]
+            for basename, member in members:
+                relative_name = prefix + basename
+                if not isinstance(member, SoftLink) or visit_links:
+                    if visititems:
+                        ret = func(relative_name, member)
+                    else:
+                        ret = func(relative_name)
+                    if ret is not None:
+                        return ret
+                if isinstance(member, Group):
+                    stack.append((relative_name + "/", iter(member.items())))
+                    break
+            else:
+                stack.pop()
+        return None
 
     def create_group(self, name):
         """Create and return a new subgroup.
@@ -158,9 +158,11 @@ You can test for existence of data or groups::
 """
 
 import datetime
+import functools
 import logging
 import re
 import io
+import weakref
 
 import h5py
 import numpy
@@ -189,9 +191,46 @@ def to_h5py_utf8(str_list):
     return numpy.array(str_list, dtype=text_dtype)
 
 
+@functools.lru_cache()
+def _cached_attr_utf8(string):
+    """Returns a cached :func:`to_h5py_utf8` conversion of a constant
+    attribute value.
+
+    All the callers get the same shared array, which is made read-only:
+    it must not be modified, and must be copied if a mutable value is
+    needed.
+
+    :param str string: Attribute value
+    :rtype: numpy.ndarray
+    """
+    value = to_h5py_utf8(string)
+    value.flags.writeable = False
+    return value
+
+
+_NUMBER_OF_MCA_ANALYSERS = weakref.WeakKeyDictionary()
+"""Cache of the number of MCA analysers of each scan"""
+
+
 def _get_number_of_mca_analysers(scan):
+    """Returns a cached version of the number of MCA analysers of a scan.
+
+    :param scan: specfile.Scan instance
+    :rtype: int
+    :raises ValueError: If the number of MCA spectra is not a multiple of
+        the number of data lines
+    """
+    number_of_analysers = _NUMBER_OF_MCA_ANALYSERS.get(scan)
+    if number_of_analysers is None:
+        number_of_analysers = _compute_number_of_mca_analysers(scan)
+        _NUMBER_OF_MCA_ANALYSERS[scan] = number_of_analysers
+    return number_of_analysers
+
+
+def _compute_number_of_mca_analysers(scan):
     """
-    :param SpecFile sf: :class:`SpecFile` instance
+    :param scan: specfile.Scan instance
+    :rtype: int
     """
     number_of_mca_spectra = len(scan.mca)
     # Scan.data is transposed
@@ -199,7 +238,10 @@ def _get_number_of_mca_analysers(scan):
 
     if not number_of_data_lines == 0:
         # Number of MCA spectra must be a multiple of number of data lines
-        assert number_of_mca_spectra % number_of_data_lines == 0
+        if number_of_mca_spectra % number_of_data_lines != 0:
+            raise ValueError(
+                "Number of MCA spectra (%d) is not a multiple of the number "
+                "of data lines (%d)" % (number_of_mca_spectra, number_of_data_lines))
         return number_of_mca_spectra // number_of_data_lines
     elif number_of_mca_spectra:
         # Case of a scan without data lines, only MCA.
@@ -210,40 +252,28 @@ def _get_number_of_mca_analysers(scan):
         return 0
 
 
-def _motor_in_scan(sf, scan_key, motor_name):
-    """
-    :param sf: :class:`SpecFile` instance
-    :param scan_key: Scan identification key (e.g. ``1.1``)
-    :param motor_name: Name of motor as defined in file header lines
-    :return: ``True`` if motor exists in scan, else ``False``
-    :raise: ``KeyError`` if scan_key not found in SpecFile
-    """
-    if scan_key not in sf:
-        raise KeyError("Scan key %s " % scan_key +
-                       "does not exist in SpecFile %s" % sf.filename)
-    ret = motor_name in sf[scan_key].motor_names
-    if not ret and "%" in motor_name:
-        motor_name = motor_name.replace("%", "/")
-        ret = motor_name in sf[scan_key].motor_names
-    return ret
+def _data_columns_by_label(scan):
+    """Return the data columns of a scan as a dict indexed by column label.
 
+    Columns are row views of the cached :attr:`specfile.Scan.data` array,
+    which avoids reading each column again from the file. They are float64:
+    :class:`SpecH5NodeDataset` still stores a float32 copy of them.
+    For duplicated labels, the first column is used, like
+    :meth:`specfile.Scan.data_column_by_name`.
 
-def _column_label_in_scan(sf, scan_key, column_label):
-    """
-    :param sf: :class:`SpecFile` instance
-    :param scan_key: Scan identification key (e.g. ``1.1``)
-    :param column_label: Column label as defined in scan header
-    :return: ``True`` if data column label exists in scan, else ``False``
-    :raise: ``KeyError`` if scan_key not found in SpecFile
+    :param scan: specfile.Scan instance
+    :return: dict of 1D arrays, empty if the data does not have one
+        column per label
     """
-    if scan_key not in sf:
-        raise KeyError("Scan key %s " % scan_key +
-                       "does not exist in SpecFile %s" % sf.filename)
-    ret = column_label in sf[scan_key].labels
-    if not ret and "%" in column_label:
-        column_label = column_label.replace("%", "/")
-        ret = column_label in sf[scan_key].labels
-    return ret
+    labels = scan.labels
+    data = scan.data
+    if data.ndim != 2 or data.shape[0] != len(labels):
+        return {}
+    columns = {}
+    for index, label in enumerate(labels):
+        if label not in columns:
+            columns[label] = data[index]
+    return columns
 
 
 def _parse_UB_matrix(header_line):
@@ -315,17 +345,60 @@ def _parse_ctime(ctime_lines, analyser_index=0):
         are in a scan.
     :return: (preset_time, live_time, elapsed_time)
     """
-    ctime_lines = ctime_lines.lstrip("@CTIME ")
     ctimes_lines_list = ctime_lines.split("\n")
     if len(ctimes_lines_list) == 1:
         # single @CTIME line for all devices
         ctime_line = ctimes_lines_list[0]
     else:
         ctime_line = ctimes_lines_list[analyser_index]
-    if not len(ctime_line.split()) == 3:
+    values = ctime_line.split()
+    if values and values[0] == "@CTIME":
+        values = values[1:]
+    if not len(values) == 3:
         raise ValueError("Incorrect format for @CTIME header line " +
                          '(expected "@CTIME %f %f %f").')
-    return list(map(float, ctime_line.split()))
+    return list(map(float, values))
+
+
+_MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul',
+           'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+_DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def _compile_spec_date_rxs():
+    """Returns the compiled regular expressions of the supported SpecFile
+    date formats.
+
+    :rtype: List[re.Pattern]
+    """
+    days_rx = '(?P<day>' + '|'.join(_DAYS) + ')'
+    months_rx = '(?P<month>' + '|'.join(_MONTHS) + ')'
+    year_rx = r'(?P<year>\d{4})'
+    day_nb_rx = r'(?P<day_nb>[0-3 ]\d)'
+    month_nb_rx = r'(?P<month_nb>[0-1]\d)'
+    hh_rx = r'(?P<hh>[0-2]\d)'
+    mm_rx = r'(?P<mm>[0-5]\d)'
+    ss_rx = r'(?P<ss>[0-5]\d)'
+    tz_rx = r'(?P<tz>[+-]\d\d:\d\d){0,1}'
+
+    # date formats must have either month_nb (1..12) or month (Jan, Feb, ...)
+    re_tpls = ['{days} {months} {day_nb} {hh}:{mm}:{ss}{tz} {year}',
+               '{days} {year}/{month_nb}/{day_nb} {hh}:{mm}:{ss}{tz}']
+
+    return [re.compile(rx.format(days=days_rx,
+                                 months=months_rx,
+                                 year=year_rx,
+                                 day_nb=day_nb_rx,
+                                 month_nb=month_nb_rx,
+                                 hh=hh_rx,
+                                 mm=mm_rx,
+                                 ss=ss_rx,
+                                 tz=tz_rx))
+            for rx in re_tpls]
+
+
+_SPEC_DATE_RXS = _compile_spec_date_rxs()
+"""Compiled regular expressions used by :func:`spec_date_to_iso8601`"""
 
 
 def spec_date_to_iso8601(date, zone=None):
@@ -354,37 +427,10 @@ def spec_date_to_iso8601(date, zone=None):
         >>> spec_date_to_iso8601("Sat 2015/03/14 03:53:50")
         '2015-03-14T03:53:50'
     """
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul',
-              'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-
-    days_rx = '(?P<day>' + '|'.join(days) + ')'
-    months_rx = '(?P<month>' + '|'.join(months) + ')'
-    year_rx = r'(?P<year>\d{4})'
-    day_nb_rx = r'(?P<day_nb>[0-3 ]\d)'
-    month_nb_rx = r'(?P<month_nb>[0-1]\d)'
-    hh_rx = r'(?P<hh>[0-2]\d)'
-    mm_rx = r'(?P<mm>[0-5]\d)'
-    ss_rx = r'(?P<ss>[0-5]\d)'
-    tz_rx = r'(?P<tz>[+-]\d\d:\d\d){0,1}'
-
-    # date formats must have either month_nb (1..12) or month (Jan, Feb, ...)
-    re_tpls = ['{days} {months} {day_nb} {hh}:{mm}:{ss}{tz} {year}',
-               '{days} {year}/{month_nb}/{day_nb} {hh}:{mm}:{ss}{tz}']
-
     grp_d = None
 
-    for rx in re_tpls:
-        full_rx = rx.format(days=days_rx,
-                            months=months_rx,
-                            year=year_rx,
-                            day_nb=day_nb_rx,
-                            month_nb=month_nb_rx,
-                            hh=hh_rx,
-                            mm=mm_rx,
-                            ss=ss_rx,
-                            tz=tz_rx)
-        m = re.match(full_rx, date)
+    for rx in _SPEC_DATE_RXS:
+        m = rx.match(date)
 
         if m:
             grp_d = m.groupdict()
@@ -398,7 +444,7 @@ def spec_date_to_iso8601(date, zone=None):
     month = grp_d.get('month_nb')
 
     if not month:
-        month = '{0:02d}'.format(months.index(grp_d.get('month')) + 1)
+        month = '{0:02d}'.format(_MONTHS.index(grp_d.get('month')) + 1)
 
     day = grp_d['day_nb']
 
@@ -432,15 +478,23 @@ def _demultiplex_mca(scan, analyser_index):
     :type analyser_index: int
     :return: 2D numpy array containing all spectra for one analyser
     """
+    mca = scan.mca
     number_of_analysers = _get_number_of_mca_analysers(scan)
-    number_of_spectra = len(scan.mca)
+    number_of_spectra = len(mca)
     number_of_spectra_per_analyser = number_of_spectra // number_of_analysers
-    len_spectrum = len(scan.mca[analyser_index])
+    # The first spectrum gives the spectrum length, it is read only once
+    first_spectrum = mca[analyser_index]
 
-    mca_array = numpy.empty((number_of_spectra_per_analyser, len_spectrum))
+    mca_array = numpy.empty((number_of_spectra_per_analyser, len(first_spectrum)))
+    if number_of_spectra_per_analyser == 0:
+        return mca_array
 
-    for i in range(number_of_spectra_per_analyser):
-        mca_array[i, :] = scan.mca[analyser_index + i * number_of_analysers]
+    mca_array[0] = first_spectrum
+    mca_indices = range(analyser_index + number_of_analysers,
+                        analyser_index + number_of_spectra_per_analyser * number_of_analysers,
+                        number_of_analysers)
+    for i, mca_index in enumerate(mca_indices, 1):
+        mca_array[i] = mca[mca_index]
 
     return mca_array
 
@@ -465,6 +519,11 @@ class SpecH5NodeDataset(commonh5.Dataset, SpecH5Dataset):
     little extra functionality. The main additional functionality is the
     proxy behavior that allows to mimic the numpy array stored in this
     class.
+
+    Float data is stored as float32. Arrays which already have the stored
+    type (float32, integer or boolean arrays) are stored without a copy:
+    the dataset then shares the array given as `data`, which must not be
+    modified afterwards.
     """
     def __init__(self, name, data, parent=None, attrs=None):
         # get proper value types, to inherit from numpy
@@ -477,9 +536,13 @@ class SpecH5NodeDataset(commonh5.Dataset, SpecH5Dataset):
             value = numpy.float32(data)
         elif isinstance(data, int):
             value = numpy.int_(data)
+        elif isinstance(data, numpy.ndarray) and data.dtype == numpy.float32:
+            # already the expected type for floats, avoid a copy
+            value = data
         else:
-            # Enforce numpy array
-            array = numpy.array(data)
+            # Enforce numpy array, without copying existing arrays as
+            # they are converted below if needed
+            array = numpy.asarray(data)
             data_kind = array.dtype.kind
 
             if data_kind in ["S", "U"]:
@@ -559,15 +622,16 @@ class SpecH5(commonh5.File, SpecH5Group):
 
         self._sf = SpecFile(filename)
 
-        attrs = {"NX_class": to_h5py_utf8("NXroot"),
+        attrs = {"NX_class": _cached_attr_utf8("NXroot"),
                  "file_time": to_h5py_utf8(
                          datetime.datetime.now().isoformat()),
                  "file_name": to_h5py_utf8(filename),
                  "creator": to_h5py_utf8("silx spech5 %s" % silx_version)}
         commonh5.File.__init__(self, filename, attrs=attrs)
 
-        for scan_key in self._sf.keys():
-            scan = self._sf[scan_key]
+        # keys() and iteration share the same scan order: this avoids
+        # resolving each "n.m" key back into a scan index
+        for scan_key, scan in zip(self._sf.keys(), self._sf):
             scan_group = ScanGroup(scan_key, parent=self, scan=scan)
             self.add_node(scan_group)
 
@@ -585,7 +649,7 @@ class ScanGroup(commonh5.Group, SpecH5Group):
         :param scan: specfile.Scan object
         """
         commonh5.Group.__init__(self, scan_key, parent=parent,
-                                attrs={"NX_class": to_h5py_utf8("NXentry")})
+                                attrs={"NX_class": _cached_attr_utf8("NXentry")})
 
         # take title in #S after stripping away scan number and spaces
         s_hdr_line = scan.scan_header_dict["S"]
@@ -635,7 +699,7 @@ class InstrumentGroup(commonh5.Group, SpecH5Group):
         :param scan: specfile.Scan object
         """
         commonh5.Group.__init__(self, name="instrument", parent=parent,
-                                attrs={"NX_class": to_h5py_utf8("NXinstrument")})
+                                attrs={"NX_class": _cached_attr_utf8("NXinstrument")})
 
         self.add_node(InstrumentSpecfileGroup(parent=self, scan=scan))
         self.add_node(PositionersGroup(parent=self, scan=scan))
@@ -650,7 +714,7 @@ class InstrumentGroup(commonh5.Group, SpecH5Group):
 class InstrumentSpecfileGroup(commonh5.Group, SpecH5Group):
     def __init__(self, parent, scan):
         commonh5.Group.__init__(self, name="specfile", parent=parent,
-                                attrs={"NX_class": to_h5py_utf8("NXcollection")})
+                                attrs={"NX_class": _cached_attr_utf8("NXcollection")})
         self.add_node(SpecH5NodeDataset(
                 name="file_header",
                 data=to_h5py_utf8(scan.file_header),
@@ -666,14 +730,15 @@ class InstrumentSpecfileGroup(commonh5.Group, SpecH5Group):
 class PositionersGroup(commonh5.Group, SpecH5Group):
     def __init__(self, parent, scan):
         commonh5.Group.__init__(self, name="positioners", parent=parent,
-                                attrs={"NX_class": to_h5py_utf8("NXcollection")})
+                                attrs={"NX_class": _cached_attr_utf8("NXcollection")})
 
         dataset_info = []  # Store list of positioner's (name, value)
         is_error = False   # True if error encountered
 
+        labels = set(scan.labels)
         for motor_name in scan.motor_names:
             safe_motor_name = motor_name.replace("/", "%")
-            if motor_name in scan.labels and scan.data.shape[0] > 0:
+            if motor_name in labels and scan.data.shape[0] > 0:
                 # return a data column if one has the same label as the motor
                 motor_value = scan.data_column_by_name(motor_name)
             else:
@@ -703,7 +768,7 @@ class InstrumentMcaGroup(commonh5.Group, SpecH5Group):
     def __init__(self, parent, analyser_index, scan):
         name = "mca_%d" % analyser_index
         commonh5.Group.__init__(self, name=name, parent=parent,
-                                attrs={"NX_class": to_h5py_utf8("NXdetector")})
+                                attrs={"NX_class": _cached_attr_utf8("NXdetector")})
 
         mcaDataDataset = McaDataDataset(parent=self,
                                      analyser_index=analyser_index,
@@ -741,8 +806,8 @@ class InstrumentMcaGroup(commonh5.Group, SpecH5Group):
                                         data=channels_dataset,
                                         parent=self))
 
-        if "CTIME" in scan.mca_header_dict:
-            ctime_line = scan.mca_header_dict['CTIME']
+        ctime_line = scan.mca_header_dict.get("CTIME")
+        if ctime_line is not None:
             preset_time, live_time, elapsed_time = _parse_ctime(ctime_line, analyser_index)
             self.add_node(SpecH5NodeDataset(name="preset_time",
                                             data=preset_time,
@@ -760,7 +825,7 @@ class McaDataDataset(SpecH5LazyNodeDataset):
     def __init__(self, parent, analyser_index, scan):
         commonh5.LazyLoadableDataset.__init__(
             self, name="data", parent=parent,
-            attrs={"interpretation": to_h5py_utf8("spectrum"),})
+            attrs={"interpretation": _cached_attr_utf8("spectrum"),})
         self._scan = scan
         self._analyser_index = analyser_index
         self._shape = None
@@ -823,11 +888,15 @@ class MeasurementGroup(commonh5.Group, SpecH5Group):
         :param scan: specfile.Scan object
         """
         commonh5.Group.__init__(self, name="measurement", parent=parent,
-                                attrs={"NX_class": to_h5py_utf8("NXcollection"),})
+                                attrs={"NX_class": _cached_attr_utf8("NXcollection"),})
+        columns = _data_columns_by_label(scan)
         for label in scan.labels:
             safe_label = label.replace("/", "%")
+            column = columns.get(label)
+            if column is None:
+                column = scan.data_column_by_name(label)
             self.add_node(SpecH5NodeDataset(name=safe_label,
-                                            data=scan.data_column_by_name(label),
+                                            data=column,
                                             parent=self))
 
         num_analysers = _get_number_of_mca_analysers(scan)
@@ -858,23 +927,24 @@ class SampleGroup(commonh5.Group, SpecH5Group):
         :param scan: specfile.Scan object
         """
         commonh5.Group.__init__(self, name="sample", parent=parent,
-                                attrs={"NX_class": to_h5py_utf8("NXsample"),})
+                                attrs={"NX_class": _cached_attr_utf8("NXsample"),})
 
         if _unit_cell_in_scan(scan):
+            unit_cell = _parse_unit_cell(scan.scan_header_dict["G1"])
             self.add_node(SpecH5NodeDataset(name="unit_cell",
-                                            data=_parse_unit_cell(scan.scan_header_dict["G1"]),
+                                            data=unit_cell,
                                             parent=self,
-                                            attrs={"interpretation": to_h5py_utf8("scalar")}))
+                                            attrs={"interpretation": _cached_attr_utf8("scalar")}))
             self.add_node(SpecH5NodeDataset(name="unit_cell_abc",
-                                            data=_parse_unit_cell(scan.scan_header_dict["G1"])[0, 0:3],
+                                            data=unit_cell[0, 0:3],
                                             parent=self,
-                                            attrs={"interpretation": to_h5py_utf8("scalar")}))
+                                            attrs={"interpretation": _cached_attr_utf8("scalar")}))
             self.add_node(SpecH5NodeDataset(name="unit_cell_alphabetagamma",
-                                            data=_parse_unit_cell(scan.scan_header_dict["G1"])[0, 3:6],
+                                            data=unit_cell[0, 3:6],
                                             parent=self,
-                                            attrs={"interpretation": to_h5py_utf8("scalar")}))
+                                            attrs={"interpretation": _cached_attr_utf8("scalar")}))
         if _ub_matrix_in_scan(scan):
             self.add_node(SpecH5NodeDataset(name="ub_matrix",
                                             data=_parse_UB_matrix(scan.scan_header_dict["G3"]),
                                             parent=self,
-                                            attrs={"interpretation": to_h5py_utf8("scalar")}))
+                                            attrs={"interpretation": _cached_attr_utf8("scalar")}))
@@ -108,6 +108,24 @@ class _TestCommonFeatures(unittest.TestCase):
         self.assertTrue(isinstance(link, (h5py.SoftLink, commonh5.SoftLink)))
         self.assertTrue(silx.io.utils.is_softlink(link))
         self.assertEqual(classlink, h5py.SoftLink)
+
+    def test_visit(self):
+        names = []
+        self.h5.visit(names.append)
+        # other tests can add groups to the shared file
+        for name in ("group", "group/dataset", "link"):
+            self.assertIn(name, names)
+        self.assertNotIn("link/soft_link", names)
+        names = []
+        self.h5["group"].visit(names.append)
+        self.assertEqual(names, ["dataset"])
+
+    def test_visit_stop(self):
+        def find_dataset(name):
+            if name.endswith("dataset"):
+                return name
+            return None
+        self.assertEqual(self.h5["group"].visit(find_dataset), "dataset")
  
     def test_external_link(self):
         node = self.h5["link/external_link"]
@@ -234,6 +252,21 @@ class TestSpecificCommonH5(unittest.TestCase):
         except RuntimeError:
             pass
 
+    def test_readonly_soft_link(self):
+        f = commonh5.File(name="Foo", mode="r")
+        group = commonh5.Group("group")
+        group.add_node(commonh5.Dataset("dataset", data=numpy.array([1])))
+        f.add_node(group)
+        f.add_node(commonh5.SoftLink("link", "/group"))
+        f.add_node(commonh5.SoftLink("broken", "/foo"))
+        node = f["link"]
+        self.assertTrue(silx.io.is_group(node))
+        self.assertEqual(node.name, "/link")
+        self.assertIs(f["link"], node)
+        self.assertEqual(f["link/dataset"][0], 1)
+        with self.assertRaises(KeyError):
+            f["broken"]
+
     def test_create_dataset(self):
         f = commonh5.File(name="Foo", mode="w")
         node = f.create_dataset("foo", data=numpy.array([1]))
@@ -205,6 +205,26 @@ class TestSpecDate(unittest.TestCase):
             self.check_date_formats(second=second, msg='second')
 
 
+class TestParseCtime(unittest.TestCase):
+    """
+    Test of the _parse_ctime function.
+    """
+
+    def testWithoutKeyword(self):
+        self.assertEqual(spech5._parse_ctime("1.0 2.0 3.0"), [1., 2., 3.])
+
+    def testWithKeyword(self):
+        self.assertEqual(spech5._parse_ctime("@CTIME 1.0 2.0 3.0"), [1., 2., 3.])
+
+    def testManyAnalysers(self):
+        ctime_lines = "@CTIME 1.0 2.0 3.0\n@CTIME 4.0 5.0 6.0"
+        self.assertEqual(spech5._parse_ctime(ctime_lines, 1), [4., 5., 6.])
+
+    def testWrongFormat(self):
+        with self.assertRaises(ValueError):
+            spech5._parse_ctime("@CTIME 1.0 2.0")
+
+
 class TestSpecH5(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
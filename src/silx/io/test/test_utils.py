@@ -327,6 +327,11 @@ class TestOpen(unittest.TestCase):
         h5["group/group/dataset"] = 50
         h5.close()
 
+        cls.paged_h5_filename = os.path.join(directory, "test_paged.h5")
+        h5 = h5py.File(cls.paged_h5_filename, mode="w", fs_strategy="page")
+        h5["group/dataset"] = numpy.arange(10)
+        h5.close()
+
         cls.spec_filename = os.path.join(directory, "test.dat")
         utils.savespec(cls.spec_filename, [1], [1.1], xlabel="x", ylabel="y",
                        fmt=["%d", "%.2f"], close_file=True, scan_number=1)
@@ -360,6 +365,21 @@ class TestOpen(unittest.TestCase):
             self.assertIsNotNone(f)
             self.assertIsInstance(f, h5py.File)
 
+    def testH5Cache(self):
+        with utils.open(self.h5_filename) as f:
+            rdcc_nbytes = f.id.get_access_plist().get_cache()[2]
+            self.assertEqual(rdcc_nbytes, utils.DEFAULT_RDCC_NBYTES)
+            page_buf_size = f.id.get_access_plist().get_page_buffer_size()[0]
+            self.assertEqual(page_buf_size, 0)
+
+    @unittest.skipIf(h5py.version.version_tuple < (3, 3),
+                     "Page buffer requires h5py >= 3.3")
+    def testH5Paged(self):
+        with utils.open(self.paged_h5_filename) as f:
+            self.assertEqual(f["group/dataset"][5], 5)
+            page_buf_size = f.id.get_access_plist().get_page_buffer_size()[0]
+            self.assertEqual(page_buf_size, utils.DEFAULT_PAGE_BUF_SIZE)
+
     def testH5_withPath(self):
         f = utils.open(self.h5_filename + "::/group/group/dataset")
         self.assertIsNotNone(f)
@@ -398,6 +418,14 @@ class TestOpen(unittest.TestCase):
     def testUnsupported(self):
         self.assertRaises(IOError, utils.open, self.txt_filename)
 
+    def testImportFormatModule(self):
+        module = utils._import_format_module("spech5")
+        self.assertIs(utils._import_format_module("spech5"), module)
+        for _ in range(2):
+            with self.assertRaises(ImportError):
+                utils._import_format_module("not_a_module")
+        self.assertIsInstance(utils._FORMAT_MODULES["not_a_module"], str)
+
     def testNotExists(self):
         # load it
         self.assertRaises(IOError, utils.open, self.missing_filename)
@@ -28,6 +28,7 @@ __date__ = "03/12/2020"
 
 import enum
 import fnmatch
+import importlib
 import os.path
 import sys
 import time
@@ -55,6 +56,14 @@ logger = logging.getLogger(__name__)
 NEXUS_HDF5_EXT = [".h5", ".nx5", ".nxs", ".hdf", ".hdf5", ".cxi"]
 """List of possible extensions for HDF5 file formats."""
 
+DEFAULT_RDCC_NBYTES = 16 * 1024 * 1024
+"""Size in bytes of the raw data chunk cache used by :func:`open` for HDF5
+files (h5py default is 1 MiB)."""
+
+DEFAULT_PAGE_BUF_SIZE = 16 * 1024 * 1024
+"""Size in bytes of the page buffer used by :func:`open` for HDF5 files
+created with the paged file space strategy."""
+
 
 class H5Type(enum.Enum):
     """Identify a set of HDF5 concepts"""
@@ -449,6 +458,75 @@ def h5ls(h5group, lvl=0):
     return h5repr
 
 
+_FORMAT_MODULES = {}
+"""Cache of the optional format modules, or of their import error message"""
+
+
+def _import_format_module(name):
+    """Import a format module of `silx.io` (like `fabioh5`) on first use.
+
+    The modules are not imported at module level to avoid circular imports
+    and the load of optional dependencies. Import failures are cached too,
+    as Python does not cache them and would search the path again on each
+    call.
+
+    :param str name: Name of the module inside `silx.io`
+    :raises ImportError: If the module can't be imported
+    """
+    module = _FORMAT_MODULES.get(name)
+    if module is None:
+        try:
+            module = importlib.import_module("." + name, __package__)
+        except ImportError as e:
+            module = str(e)
+        _FORMAT_MODULES[name] = module
+    if isinstance(module, str):
+        raise ImportError(module)
+    return module
+
+
+def _is_paged_hdf5_file(h5file):
+    """Returns true if the HDF5 file was created with the paged file space
+    strategy.
+
+    :param h5py.File h5file: An opened HDF5 file
+    :rtype: bool
+    """
+    create_plist = h5file.id.get_create_plist()
+    strategy = create_plist.get_file_space_strategy()[0]
+    return strategy == h5py.h5f.FSPACE_STRATEGY_PAGE
+
+
+def _open_hdf5_file(filename, **kwargs):
+    """Open an HDF5 file in read-only mode, with a page buffer for paged
+    files.
+
+    The page buffer groups the metadata reads of paged files into page
+    reads. HDF5 refuses it for files which are not paged, so the file space
+    strategy is read from the file first, and only paged files are opened
+    again with a page buffer.
+
+    :param str filename: A filename
+    :param kwargs: Extra arguments passed to :class:`h5py.File`
+    :rtype: h5py.File
+    """
+    h5file = h5py.File(filename, "r", **kwargs)
+    if h5py.version.version_tuple < (3, 3) or not _is_paged_hdf5_file(h5file):
+        return h5file
+
+    h5file.close()
+    try:
+        return h5py.File(
+            filename,
+            "r",
+            page_buf_size=DEFAULT_PAGE_BUF_SIZE,
+            **kwargs,
+        )
+    except ValueError:
+        # The file page size is bigger than the page buffer
+        return h5py.File(filename, "r", **kwargs)
+
+
 def _open_local_file(filename):
     """
     Load a file as an `h5py.File`-like object.
@@ -483,12 +561,17 @@ def _open_local_file(filename):
 
         if h5py.is_hdf5(filename):
             try:
-                return h5py.File(filename, "r")
+                return _open_hdf5_file(filename, rdcc_nbytes=DEFAULT_RDCC_NBYTES)
             except OSError:
-                return h5py.File(filename, "r", libver='latest', swmr=True)
+                return _open_hdf5_file(
+                    filename,
+                    libver='latest',
+                    swmr=True,
+                    rdcc_nbytes=DEFAULT_RDCC_NBYTES,
+                )
 
         try:
-            from . import fabioh5
+            fabioh5 = _import_format_module("fabioh5")
             return fabioh5.File(filename)
         except ImportError:
             debugging_info.append((sys.exc_info(), "fabioh5 can't be loaded."))
@@ -497,7 +580,7 @@ def _open_local_file(filename):
                                    "File '%s' can't be read as fabio file." % filename))
 
         try:
-            from . import spech5
+            spech5 = _import_format_module("spech5")
             return spech5.SpecH5(filename)
         except ImportError:
             debugging_info.append((sys.exc_info(),
@@ -24,6 +24,7 @@
 # ###########################################################################*/
 import numpy as np
 from packaging.version import Version
+from silx.utils.deprecation import deprecated_warning
 
 
 def check_version(package, required_version):
@@ -51,6 +52,15 @@ class BaseFFT(object):
 
         if self.shape is None and self.dtype is None and self.template is None:
             raise ValueError("Please provide either (shape and dtype) or template")
+        if self.template is None and self.dtype is None:
+            deprecated_warning(
+                "Argument",
+                "FFT shape without dtype",
+                reason="the float64 default data type will change to float32",
+                replacement="dtype=numpy.float64",
+                since_version="2.0.0",
+            )
+            self.dtype = np.float64
         if self.template is not None:
             self.shape = self.template.shape
             self.dtype = self.template.dtype
@@ -43,6 +43,10 @@ def FFT(
         Shape of the input data.
     :param numpy.dtype dtype:
         Data type of the input data.
+        If only "shape" is provided, it defaults to float64 for all
+        back-ends. This default is deprecated and will become float32,
+        which halves the memory traffic of the transforms: pass the data
+        type explicitly.
     :param numpy.ndarray template:
         Optional data, replacement for "shape" and "dtype".
         If provided, the arguments "shape" and "dtype" are ignored,
@@ -58,6 +62,9 @@ def FFT(
         Axes along which FFT is computed.
           * For 2D transform: axes=(1,0)
           * For batched 1D transform of 2D image: axes=(0,)
+        The other axes are batch dimensions: a stack of images is
+        transformed in a single call, e.g. axes=(-2, -1) for 2D transforms
+        of each image of a 3D stack.
     :param str normalize:
         Whether to normalize FFT and IFFT. Possible values are:
           * "rescale": in this case, Fourier data is divided by "N"
@@ -58,8 +58,23 @@ class FFTW(BaseFFT):
         to be "byte aligned", which might imply extra memory usage.
     :param int num_threads:
         Number of threads for computing FFT.
+    :param str planner_effort:
+        FFTW planner flag, one of "FFTW_ESTIMATE", "FFTW_MEASURE" (default),
+        "FFTW_PATIENT" or "FFTW_EXHAUSTIVE".
+        "FFTW_ESTIMATE" creates plans without benchmarking, which is much
+        faster for short-lived instances but can give slower transforms.
+        Plans of other instances with the same geometry reuse the wisdom
+        which FFTW accumulates in memory (see :func:`export_wisdom`).
     """
 
+    PLANNER_EFFORTS = (
+        "FFTW_ESTIMATE",
+        "FFTW_MEASURE",
+        "FFTW_PATIENT",
+        "FFTW_EXHAUSTIVE",
+    )
+    """Supported values of the planner_effort parameter"""
+
     def __init__(
         self,
         shape=None,
@@ -70,6 +85,7 @@ class FFTW(BaseFFT):
         normalize="rescale",
         check_alignment=False,
         num_threads=1,
+        planner_effort="FFTW_MEASURE",
     ):
         if not (__have_fftw__):
             raise ImportError(
@@ -86,6 +102,7 @@ class FFTW(BaseFFT):
         )
         self.check_alignment = check_alignment
         self.num_threads = num_threads
+        self.planner_effort = planner_effort
         self.backend = "fftw"
 
         self.allocate_arrays()
@@ -118,7 +135,12 @@ class FFTW(BaseFFT):
     # => behavior is the same in both version :)
 
     def set_fftw_flags(self):
-        self.fftw_flags = ("FFTW_MEASURE",)  # TODO
+        if self.planner_effort not in self.PLANNER_EFFORTS:
+            raise ValueError(
+                "Unknown planner effort %s. Possible values are %s"
+                % (self.planner_effort, self.PLANNER_EFFORTS)
+            )
+        self.fftw_flags = (self.planner_effort,)
         self.fftw_planning_timelimit = None  # TODO
 
         # To skip normalization on norm="none", we should
@@ -178,21 +200,18 @@ class FFTW(BaseFFT):
         Copies are avoided when possible.
         """
         self.check_array(array, shape, dtype)
-        if id(self.refs[name]) == id(array):
+        if self.refs[name] is array:
             # nothing to do: fft is performed on self.data_in or self.data_out
-            arr_to_use = self.refs[name]
+            return array
         if self.check_alignment and not (pyfftw.is_byte_aligned(array)):
             # If the array is not properly aligned,
-            # create a temp. array copy it to self.data_in or self.data_out
-            self_array[:] = array[:]
-            arr_to_use = self_array
-        else:
-            # If the array is properly aligned, use it directly
-            if copy:
-                arr_to_use = np.copy(array)
-            else:
-                arr_to_use = array
-        return arr_to_use
+            # copy it to self.data_in or self.data_out
+            self_array[:] = array
+            return self_array
+        # If the array is properly aligned, use it directly
+        if copy:
+            return np.copy(array)
+        return array
 
     def compute_forward_plan(self):
         self.plan_forward = pyfftw.FFTW(
@@ -227,13 +246,19 @@ class FFTW(BaseFFT):
         """
         data_in = self.set_input_data(array, copy=False)
         data_out = self.set_output_data(output, copy=False)
-        self.plan_forward.update_arrays(data_in, data_out)
+        # The plan is bound to the internal arrays: only rebind it when
+        # other arrays are used, as update_arrays() checks them
+        use_refs = (data_in is self.refs["data_in"]
+                    and data_out is self.refs["data_out"])
+        if not use_refs:
+            self.plan_forward.update_arrays(data_in, data_out)
         # execute.__call__ does both update_arrays() and normalization
         self.plan_forward(  # [0] --> fft
             ortho=self.fftw_norm_mode[0]["ortho"],
             normalise_idft=self.fftw_norm_mode[0]["normalise_idft"],
         )
-        self.plan_forward.update_arrays(self.refs["data_in"], self.refs["data_out"])
+        if not use_refs:
+            self.plan_forward.update_arrays(self.refs["data_in"], self.refs["data_out"])
         return data_out
 
     def ifft(self, array, output=None):
@@ -247,17 +272,55 @@ class FFTW(BaseFFT):
         """
         data_in = self.set_output_data(array, copy=False)
         data_out = self.set_input_data(output, copy=False)
-        self.plan_inverse.update_arrays(
-            data_in, data_out
-        )  # TODO why in/out when it is out/in everywhere else in the function
+        use_refs = (data_in is self.refs["data_out"]
+                    and data_out is self.refs["data_in"])
+        if not use_refs:
+            self.plan_inverse.update_arrays(
+                data_in, data_out
+            )  # TODO why in/out when it is out/in everywhere else in the function
         # execute.__call__ does both update_arrays() and normalization
         self.plan_inverse(  # [1] --> ifft
             ortho=self.fftw_norm_mode[1]["ortho"],
             normalise_idft=self.fftw_norm_mode[1]["normalise_idft"],
         )
-        self.plan_inverse.update_arrays(self.refs["data_out"], self.refs["data_in"])
+        if not use_refs:
+            self.plan_inverse.update_arrays(self.refs["data_out"], self.refs["data_in"])
         return data_out
 
+    def convolve(self, array, kernel_spectrum, output=None):
+        """
+        Perform a FFT, a multiplication by a spectrum and an inverse FFT.
+
+        Both transforms use the internal arrays the plans are bound to,
+        so that no plan update is needed.
+
+        :param numpy.ndarray array:
+            Input data. Must be consistent with the current context.
+        :param numpy.ndarray kernel_spectrum:
+            Spectrum to multiply the FFT of the data with.
+            Must be broadcastable to the shape of the FFT output.
+        :param numpy.ndarray output:
+            Optional output data. If not provided, the internal input array
+            is returned.
+        """
+        self.check_array(array, self.shape, self.dtype_in)
+        if array is not self.data_in:
+            self.data_in[:] = array
+        self.plan_forward(  # [0] --> fft
+            ortho=self.fftw_norm_mode[0]["ortho"],
+            normalise_idft=self.fftw_norm_mode[0]["normalise_idft"],
+        )
+        np.multiply(self.data_out, kernel_spectrum, out=self.data_out)
+        self.plan_inverse(  # [1] --> ifft
+            ortho=self.fftw_norm_mode[1]["ortho"],
+            normalise_idft=self.fftw_norm_mode[1]["normalise_idft"],
+        )
+        if output is None:
+            return self.data_in
+        self.check_array(output, self.shape, self.dtype_in)
+        output[:] = self.data_in
+        return output
+
 
 
 def get_wisdom_metadata():
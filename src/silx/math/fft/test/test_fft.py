@@ -396,3 +396,49 @@ def test_fftw_wisdom():
         assert path.isfile(fname)
         import_wisdom(fname)
 
+
+@pytest.mark.skipif(not(__have_fftw__), reason="Need fftw/pyfftw for this test")
+def test_fftw_planner_effort():
+    """
+    Test FFTW plans created without measurement
+    """
+    data = np.random.rand(64, 32).astype(np.float32)
+    F = FFT(template=data, backend="fftw", planner_effort="FFTW_ESTIMATE")
+    assert F.fftw_flags == ("FFTW_ESTIMATE",)
+    assert F.dtype_out == np.complex64
+    assert np.allclose(F.ifft(F.fft(data)), data, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        FFT(template=data, backend="fftw", planner_effort="FFTW_FAST")
+
+
+@pytest.mark.skipif(not(__have_fftw__), reason="Need fftw/pyfftw for this test")
+def test_fftw_convolve():
+    """
+    Test FFTW convolution against numpy
+    """
+    data = np.random.rand(64, 32).astype(np.float32)
+    kernel = np.zeros_like(data)
+    kernel[:3, :3] = 1. / 9
+    kernel_spectrum = np.fft.rfft2(kernel)
+    ref = np.fft.irfft2(np.fft.rfft2(data) * kernel_spectrum, s=data.shape)
+
+    F = FFT(template=data, backend="fftw")
+    assert np.allclose(F.convolve(data, kernel_spectrum), ref, atol=1e-5)
+    output = np.zeros_like(data)
+    assert F.convolve(data, kernel_spectrum, output=output) is output
+    assert np.allclose(output, ref, atol=1e-5)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "fftw"])
+def test_default_dtype(backend):
+    """
+    Test that back-ends agree on the (deprecated) default data type
+    """
+    if backend == "fftw" and not __have_fftw__:
+        pytest.skip("Need fftw/pyfftw for this test")
+    F = FFT(shape=(64, 32), backend=backend)
+    assert F.dtype_in == np.float64
+    assert F.dtype_out == np.complex128
+    data = np.random.rand(64, 32)
+    assert np.allclose(F.ifft(F.fft(data)), data)
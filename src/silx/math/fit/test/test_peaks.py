@@ -30,6 +30,9 @@ import pytest
 from silx.math.fit import functions
 from silx.math.fit import peaks
 
+_X = numpy.arange(5000)
+"""x-axis shared by all peak profiles"""
+
 _PEAK_PARAMETERS = {
     "sum_gauss": (50, 500, 100,
                     50, 600, 80,
@@ -114,7 +117,7 @@ _PEAK_PARAMETERS = {
 
 @pytest.mark.parametrize("peak_profile", list(_PEAK_PARAMETERS))
 def test_peak_functions(peak_profile):
-    x = numpy.arange(5000)
+    x = _X
     peak_params = _PEAK_PARAMETERS[peak_profile]
     func = getattr(functions, peak_profile)
 
@@ -129,7 +132,7 @@ def test_peak_functions(peak_profile):
 
 @pytest.mark.parametrize("peak_profile", list(_PEAK_PARAMETERS))
 def test_peak_search(peak_profile):
-    x = numpy.arange(5000)
+    x = _X
     peak_params = _PEAK_PARAMETERS[peak_profile]
     func = getattr(functions, peak_profile)
     y = func(x, *peak_params)